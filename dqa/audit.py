@@ -1,20 +1,22 @@
 from __future__ import annotations
 
 import json
+import stat
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, Literal
 
 from . import __version__
-from .checks.bbox_sanity import run_bbox_sanity
 from .checks.class_distribution import run_class_distribution
 from .checks.duplicates import run_exact_duplicates
-from .checks.integrity import run_integrity
 from .checks.leakage import run_leakage
 from .checks.near_duplicates import run_near_duplicates
-from .config import ConfigError, DQAConfig, load_config
+from .checks.ordering import _sort_findings
+from .checks.row_checks import run_row_checks
+from .config import ConfigError, load_config
 from .indexer import build_index, build_index_from_coco
 from .io_yolo import load_dataset_spec
 from .models import Finding
@@ -27,7 +29,7 @@ Severity = Literal["critical", "high", "medium", "low"]
 _SEVERITY_RANK = {"critical": 4, "high": 3, "medium": 2, "low": 1}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditOptions:
     out: Path
     data: Path | None = None
@@ -45,7 +47,7 @@ class AuditOptions:
     fail_on: Severity | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditResult:
     exit_code: int
     summary: dict[str, object]
@@ -53,14 +55,8 @@ class AuditResult:
     index: dict[str, object]
 
 
-def _enabled_checks(cfg: DQAConfig, include_near_duplicates: bool) -> list[str]:
-    checks: list[str] = []
-    for name in ["integrity", "class_distribution", "bbox_sanity", "duplicates", "leakage"]:
-        if getattr(cfg.checks, name).enabled:
-            checks.append(name)
-    if cfg.checks.near_duplicates.enabled or include_near_duplicates:
-        checks.append("near_duplicates")
-    return checks
+def _enabled_checks(enabled: dict[str, bool]) -> list[str]:
+    return [name for name, is_enabled in enabled.items() if is_enabled]
 
 
 def _counts(findings: Iterable[Finding]) -> dict[str, int]:
@@ -70,11 +66,6 @@ def _counts(findings: Iterable[Finding]) -> dict[str, int]:
     return counts
 
 
-def _fails_threshold(findings: Iterable[Finding], fail_on: Severity) -> bool:
-    threshold = _SEVERITY_RANK[fail_on]
-    return any(_SEVERITY_RANK[finding.severity] >= threshold for finding in findings)
-
-
 def _serialize_finding(finding: Finding) -> dict[str, object]:
     payload: dict[str, object | None] = {
         "id": finding.id,
@@ -91,14 +82,40 @@ def _serialize_finding(finding: Finding) -> dict[str, object]:
     return {key: value for key, value in payload.items() if value is not None}
 
 
+_EMPTY_COUNTS = (("critical", 0), ("high", 0), ("medium", 0), ("low", 0))
+
+
 def _empty_check() -> dict[str, object]:
-    return {"status": "skipped", "counts": {"critical": 0, "high": 0, "medium": 0, "low": 0}}
+    # Copies from a shared tuple template; callers may mutate the result,
+    # so each call still returns fresh dicts.
+    return {"status": "skipped", "counts": dict(_EMPTY_COUNTS)}
 
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
 
+def _normalize_index_rows(payload: dict[str, object]) -> None:
+    """Coerce index row fields to canonical types in one pass.
+
+    Checks then read fields directly instead of re-wrapping every access
+    in str()/int()/float(), which previously repeated the same coercions
+    once per check per row.
+    """
+    for row in payload.get("images", []):  # type: ignore[union-attr]
+        row["split"] = str(row.get("split", ""))
+        row["image"] = str(row.get("image", ""))
+        row["sha256"] = str(row.get("sha256", ""))
+        for parsed in row.get("label_rows", []):
+            parsed["class_id"] = int(parsed.get("class_id", -1))
+            parsed["line"] = int(parsed.get("line", 0))
+            parsed["annotation_type"] = str(parsed.get("annotation_type", "bbox"))
+            parsed["x_center"] = float(parsed.get("x_center", 0.0))
+            parsed["y_center"] = float(parsed.get("y_center", 0.0))
+            parsed["width"] = float(parsed.get("width", 0.0))
+            parsed["height"] = float(parsed.get("height", 0.0))
+
+
 def _load_index_cache(path: Path) -> dict[str, object] | None:
     if not path.is_file():
         return None
@@ -114,6 +131,21 @@ def audit_dataset(options: AuditOptions) -> AuditResult:
     started_at = _utc_now()
     cfg = load_config(options.config)
     fail_on: Severity = options.fail_on or cfg.fail_on
+    # Resolve each check's enabled flag once; the check dispatch and the
+    # summary's enabled_checks list both read this map.
+    checks_cfg = cfg.checks
+    enabled = {
+        "integrity": checks_cfg.integrity.enabled,
+        "class_distribution": checks_cfg.class_distribution.enabled,
+        "bbox_sanity": checks_cfg.bbox_sanity.enabled,
+        "duplicates": checks_cfg.duplicates.enabled,
+        "leakage": checks_cfg.leakage.enabled,
+        "near_duplicates": bool(checks_cfg.near_duplicates.enabled or options.near_duplicates),
+    }
+    # sha256 only feeds the duplicate/near-duplicate/leakage checks (the
+    # cache_key hashes whatever the rows carry), so indexing skips the
+    # full-file reads when none of those run.
+    need_content_hash = enabled["duplicates"] or enabled["near_duplicates"] or enabled["leakage"]
 
     if not 1 <= options.workers <= 32:
         raise ConfigError("workers must be between 1 and 32")
@@ -134,25 +166,36 @@ def audit_dataset(options: AuditOptions) -> AuditResult:
     previous_index = _load_index_cache(options.out / "index.json")
     source_suffix = source.suffix.lower()
 
-    if source.is_file() and source_suffix in {".yaml", ".yml"}:
+    # One stat answers both the is-file and is-dir questions; on network
+    # filesystems each separate Path.is_file/is_dir call is a round-trip.
+    try:
+        source_mode = source.stat().st_mode
+    except OSError:
+        source_mode = 0
+    source_is_file = stat.S_ISREG(source_mode)
+    source_is_dir = stat.S_ISDIR(source_mode)
+
+    if source_is_file and source_suffix in {".yaml", ".yml"}:
         spec = load_dataset_spec(source, requested_splits=requested_splits)
         index_result = build_index(
             spec,
             max_images=max(0, options.max_images),
             previous_index=previous_index,
             workers=options.workers,
+            need_content_hash=need_content_hash,
         )
         dataset_ref = spec.data_yaml.as_posix()
         dataset_root = spec.root.as_posix()
         class_names = spec.names
         split_names = list(spec.splits)
-    elif source.is_dir() or (source.is_file() and source_suffix == ".json"):
+    elif source_is_dir or (source_is_file and source_suffix == ".json"):
         index_result = build_index_from_coco(
             source,
             requested_splits=requested_splits,
             max_images=max(0, options.max_images),
             previous_index=previous_index,
             workers=options.workers,
+            need_content_hash=need_content_hash,
         )
         dataset_ref = str(index_result.payload.get("data_source", source.as_posix()))
         dataset_root = str(index_result.payload.get("dataset_root", ""))
@@ -162,6 +205,7 @@ def audit_dataset(options: AuditOptions) -> AuditResult:
         raise RemoteDataError(f"Unsupported dataset source: {source}")
 
     write_json(options.out / "index.json", index_result.payload)
+    _normalize_index_rows(index_result.payload)
     findings: list[Finding] = []
     checks_summary: dict[str, dict[str, object]] = {
         "integrity": _empty_check(),
@@ -172,62 +216,115 @@ def audit_dataset(options: AuditOptions) -> AuditResult:
         "leakage": _empty_check(),
     }
 
-    if cfg.checks.integrity.enabled:
-        found = run_integrity(index_result.payload, class_count=index_result.class_count)
-        findings.extend(found)
-        checks_summary["integrity"] = {"status": "completed", "counts": _counts(found)}
-    if cfg.checks.class_distribution.enabled:
-        found = run_class_distribution(
+    # Near-duplicate hashing is the only check whose work leaves the GIL
+    # (PIL decode), so it starts first on a helper thread and the pure-
+    # Python checks below overlap with the decode phase. A process pool
+    # would re-pickle the whole index per check, which costs more than
+    # the row checks themselves.
+    near_dup_enabled = enabled["near_duplicates"]
+    near_dup_future = None
+    near_dup_pool: ThreadPoolExecutor | None = None
+    if near_dup_enabled and options.workers > 1:
+        near_dup_pool = ThreadPoolExecutor(max_workers=1)
+        near_dup_future = near_dup_pool.submit(
+            run_near_duplicates,
             index_result.payload,
+            phash_hamming_threshold=checks_cfg.near_duplicates.phash_hamming_threshold,
+            workers=options.workers,
+        )
+
+    if enabled["integrity"] or enabled["bbox_sanity"]:
+        row_results = run_row_checks(
+            index_result.payload,
+            integrity=enabled["integrity"],
+            bbox_sanity=enabled["bbox_sanity"],
             class_count=index_result.class_count,
-            min_instances_per_class_warn=cfg.checks.class_distribution.min_instances_per_class_warn,
-            max_class_share_warn=cfg.checks.class_distribution.max_class_share_warn,
-            split_drift_jsd_warn=cfg.checks.class_distribution.split_drift_jsd_warn,
-            split_drift_jsd_high=cfg.checks.class_distribution.split_drift_jsd_high,
+            min_box_area_ratio_warn=checks_cfg.bbox_sanity.min_box_area_ratio_warn,
+            max_box_area_ratio_warn=checks_cfg.bbox_sanity.max_box_area_ratio_warn,
+            max_boxes_per_image_warn=checks_cfg.bbox_sanity.max_boxes_per_image_warn,
+            aspect_ratio_warn=checks_cfg.bbox_sanity.aspect_ratio_warn,
         )
-        findings.extend(found)
-        checks_summary["class_distribution"] = {"status": "completed", "counts": _counts(found)}
-    if cfg.checks.bbox_sanity.enabled:
-        found = run_bbox_sanity(
+        if enabled["integrity"]:
+            found = row_results["integrity"]
+            findings.extend(found)
+            checks_summary["integrity"] = {"status": "completed", "counts": _counts(found)}
+        if enabled["bbox_sanity"]:
+            found = row_results["bbox_sanity"]
+            findings.extend(found)
+            checks_summary["bbox_sanity"] = {"status": "completed", "counts": _counts(found)}
+    if enabled["class_distribution"]:
+        found = run_class_distribution(
             index_result.payload,
-            min_box_area_ratio_warn=cfg.checks.bbox_sanity.min_box_area_ratio_warn,
-            max_box_area_ratio_warn=cfg.checks.bbox_sanity.max_box_area_ratio_warn,
-            max_boxes_per_image_warn=cfg.checks.bbox_sanity.max_boxes_per_image_warn,
-            aspect_ratio_warn=cfg.checks.bbox_sanity.aspect_ratio_warn,
+            class_count=index_result.class_count,
+            min_instances_per_class_warn=checks_cfg.class_distribution.min_instances_per_class_warn,
+            max_class_share_warn=checks_cfg.class_distribution.max_class_share_warn,
+            split_drift_jsd_warn=checks_cfg.class_distribution.split_drift_jsd_warn,
+            split_drift_jsd_high=checks_cfg.class_distribution.split_drift_jsd_high,
         )
         findings.extend(found)
-        checks_summary["bbox_sanity"] = {"status": "completed", "counts": _counts(found)}
-    if cfg.checks.duplicates.enabled:
+        checks_summary["class_distribution"] = {"status": "completed", "counts": _counts(found)}
+    if enabled["duplicates"]:
         found = run_exact_duplicates(index_result.payload)
         findings.extend(found)
         checks_summary["duplicates"] = {"status": "completed", "counts": _counts(found)}
-    if cfg.checks.near_duplicates.enabled or options.near_duplicates:
-        found, reason = run_near_duplicates(
-            index_result.payload,
-            phash_hamming_threshold=cfg.checks.near_duplicates.phash_hamming_threshold,
-            workers=options.workers,
-        )
+    if enabled["leakage"]:
+        found = run_leakage(index_result.payload)
+        findings.extend(found)
+        checks_summary["leakage"] = {"status": "completed", "counts": _counts(found)}
+    if near_dup_enabled:
+        if near_dup_future is not None:
+            found, reason = near_dup_future.result()
+            near_dup_pool.shutdown()  # type: ignore[union-attr]
+        else:
+            found, reason = run_near_duplicates(
+                index_result.payload,
+                phash_hamming_threshold=checks_cfg.near_duplicates.phash_hamming_threshold,
+                workers=options.workers,
+            )
         findings.extend(found)
         checks_summary["near_duplicates"] = {
             "status": "completed" if reason is None else "skipped",
             "counts": _counts(found),
         }
-    if cfg.checks.leakage.enabled:
-        found = run_leakage(index_result.payload)
-        findings.extend(found)
-        checks_summary["leakage"] = {"status": "completed", "counts": _counts(found)}
 
-    findings.sort(key=lambda item: (item.id, item.split or "", item.image or "", item.label or "", item.fingerprint))
+    findings = _sort_findings(findings)
+    # Serialize, count severities, and evaluate the fail threshold in one
+    # loop instead of three separate passes over the sorted findings.
+    threshold = _SEVERITY_RANK[fail_on]
+    total_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+    build_failed = False
+    serialized: list[dict[str, object]] = []
+    for finding in findings:
+        total_counts[finding.severity] += 1
+        if _SEVERITY_RANK[finding.severity] >= threshold:
+            build_failed = True
+        serialized.append(_serialize_finding(finding))
     flags_payload: dict[str, object] = {
         "schema_version": "1.0.0",
-        "findings": [_serialize_finding(finding) for finding in findings],
+        "findings": serialized,
     }
-    write_json(options.out / "flags.json", flags_payload)
+
+    # Artifact writes release the GIL on disk I/O, so flags.json goes out
+    # while the summary is still being built, and summary.json while the
+    # HTML report renders; run.log stays last, after every future lands.
+    artifact_pool = ThreadPoolExecutor(max_workers=3)
+    flags_future = artifact_pool.submit(write_json, options.out / "flags.json", flags_payload)
+
+    # One pass over the image rows instead of three generator scans per
+    # split; with S splits that is O(N) rather than O(3*S*N).
+    split_agg: dict[str, list[int]] = {split: [0, 0, 0] for split in split_names}
+    for row in index_result.payload["images"]:  # type: ignore[union-attr]
+        agg = split_agg.get(row["split"])
+        if agg is None:
+            continue
+        agg[0] += 1
+        if row["label_exists"]:
+            agg[1] += 1
+        else:
+            agg[2] += 1
 
     finished_at = _utc_now()
     duration_sec = round(time.perf_counter() - start_perf, 3)
-    total_counts = _counts(findings)
-    build_failed = _fails_threshold(findings, fail_on)
     summary_payload: dict[str, object] = {
         "schema_version": "1.0.0",
         "run": {
@@ -238,23 +335,15 @@ def audit_dataset(options: AuditOptions) -> AuditResult:
             "duration_sec": duration_sec,
             "config": {
                 "fail_on": fail_on,
-                "enabled_checks": _enabled_checks(cfg, options.near_duplicates),
+                "enabled_checks": _enabled_checks(enabled),
             },
         },
         "dataset": {
             "data_yaml": dataset_ref,
             "root": dataset_root,
             "splits": {
-                split: {
-                    "images": sum(1 for row in index_result.payload["images"] if row["split"] == split),
-                    "labeled": sum(
-                        1 for row in index_result.payload["images"] if row["split"] == split and row["label_exists"]
-                    ),
-                    "unlabeled": sum(
-                        1 for row in index_result.payload["images"] if row["split"] == split and not row["label_exists"]
-                    ),
-                }
-                for split in split_names
+                split: {"images": agg[0], "labeled": agg[1], "unlabeled": agg[2]}
+                for split, agg in split_agg.items()
             },
             "classes": {"count": len(class_names), "names": class_names},
         },
@@ -266,23 +355,30 @@ def audit_dataset(options: AuditOptions) -> AuditResult:
             "build_failed": build_failed,
         },
     }
-    write_json(options.out / "summary.json", summary_payload)
+    summary_future = artifact_pool.submit(write_json, options.out / "summary.json", summary_payload)
+    html_future = None
     if "html" in options.formats:
-        write_html(options.out / "report.html", summary_payload, flags_payload)
-
-    run_log = [
-        f"started_at={started_at}",
-        f"finished_at={finished_at}",
-        f"duration_sec={duration_sec}",
-        f"data={dataset_ref}",
-        f"out={options.out.resolve().as_posix()}",
-        f"findings={len(findings)}",
-        f"build_failed={build_failed}",
-        f"index_cache_hits={index_result.cache_hits}",
-        f"index_cache_misses={index_result.cache_misses}",
-        f"workers={options.workers}",
-    ]
-    (options.out / "run.log").write_text("\n".join(run_log) + "\n", encoding="utf-8")
+        html_future = artifact_pool.submit(write_html, options.out / "report.html", summary_payload, flags_payload)
+    flags_future.result()
+    summary_future.result()
+    if html_future is not None:
+        html_future.result()
+    artifact_pool.shutdown()
+
+    # One f-string, one encode, one write syscall for the whole log.
+    run_log = (
+        f"started_at={started_at}\n"
+        f"finished_at={finished_at}\n"
+        f"duration_sec={duration_sec}\n"
+        f"data={dataset_ref}\n"
+        f"out={options.out.resolve().as_posix()}\n"
+        f"findings={len(findings)}\n"
+        f"build_failed={build_failed}\n"
+        f"index_cache_hits={index_result.cache_hits}\n"
+        f"index_cache_misses={index_result.cache_misses}\n"
+        f"workers={options.workers}\n"
+    )
+    (options.out / "run.log").write_bytes(run_log.encode("utf-8"))
     return AuditResult(
         exit_code=1 if build_failed else 0,
         summary=summary_payload,
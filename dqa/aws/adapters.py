@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import fields
+from dataclasses import asdict, fields
 from datetime import datetime, timedelta, timezone
 import json
 from typing import Any
@@ -321,4 +321,5 @@ class S3JobObjectStore:
 
 class JsonSecurityEventSink:
     def emit(self, event: SecurityEvent) -> None:
-        print(json.dumps({"event": "security", **event.__dict__}, separators=(",", ":"), sort_keys=True))
+        # asdict, not __dict__: SecurityEvent is slotted and has none.
+        print(json.dumps({"event": "security", **asdict(event)}, separators=(",", ":"), sort_keys=True))
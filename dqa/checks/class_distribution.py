@@ -1,35 +1,32 @@
 from __future__ import annotations
 
-import hashlib
 import math
-from collections import Counter, defaultdict
 from typing import Any
 
 from ..models import Finding
+from .fingerprint import _fp
+from .ordering import _sort_findings
 
 
-def _fp(*parts: str) -> str:
-    raw = "|".join(parts).encode("utf-8")
-    return "sha1:" + hashlib.sha1(raw, usedforsecurity=False).hexdigest()
-
-
-def _distribution(counts: Counter[int], class_count: int) -> list[float]:
-    total = float(sum(counts.values()))
+def _distribution(counts: list[int] | None, class_count: int) -> list[float]:
+    total = float(sum(counts)) if counts else 0.0
     if total <= 0:
-        return [0.0 for _ in range(class_count)]
-    return [counts.get(i, 0) / total for i in range(class_count)]
+        return [0.0] * class_count
+    return [count / total for count in counts]
 
 
 def _jsd(p: list[float], q: list[float]) -> float:
-    def _kl(a: list[float], b: list[float]) -> float:
-        s = 0.0
-        for ai, bi in zip(a, b):
-            if ai > 0 and bi > 0:
-                s += ai * math.log2(ai / bi)
-        return s
-
-    m = [(pi + qi) / 2.0 for pi, qi in zip(p, q)]
-    return 0.5 * _kl(p, m) + 0.5 * _kl(q, m)
+    # Fused form of 0.5*KL(p||m) + 0.5*KL(q||m) with m = (p+q)/2: one pass,
+    # no intermediate midpoint list, and log2 bound once outside the loop.
+    log2 = math.log2
+    s = 0.0
+    for pi, qi in zip(p, q):
+        mi = (pi + qi) / 2.0
+        if pi > 0.0:
+            s += pi * log2(pi / mi)
+        if qi > 0.0:
+            s += qi * log2(qi / mi)
+    return 0.5 * s
 
 
 def run_class_distribution(
@@ -42,20 +39,26 @@ def run_class_distribution(
 ) -> list[Finding]:
     findings: list[Finding] = []
 
-    global_counts: Counter[int] = Counter()
-    split_counts: dict[str, Counter[int]] = defaultdict(Counter)
+    # Bincount-style flat lists: incrementing a pre-sized list slot is
+    # cheaper than a Counter dict bump per label row.
+    global_counts = [0] * class_count
+    split_counts: dict[str, list[int]] = {}
 
     for row in index_payload.get("images", []):
-        split = str(row.get("split", ""))
+        split = row.get("split", "")
+        counts = split_counts.get(split)
+        if counts is None:
+            counts = split_counts[split] = [0] * class_count
         for parsed in row.get("label_rows", []):
-            class_id = int(parsed.get("class_id", -1))
+            class_id = parsed.get("class_id", -1)
             if 0 <= class_id < class_count:
                 global_counts[class_id] += 1
-                split_counts[split][class_id] += 1
+                counts[class_id] += 1
 
-    total_instances = sum(global_counts.values())
+    total_instances = sum(global_counts)
     if total_instances > 0:
-        dominant_class, dominant_count = max(global_counts.items(), key=lambda x: x[1])
+        dominant_count = max(global_counts)
+        dominant_class = global_counts.index(dominant_count)
         dominant_share = dominant_count / float(total_instances)
         if dominant_share > max_class_share_warn:
             findings.append(
@@ -73,8 +76,7 @@ def run_class_distribution(
                 )
             )
 
-    for class_id in range(class_count):
-        count = int(global_counts.get(class_id, 0))
+    for class_id, count in enumerate(global_counts):
         if count < min_instances_per_class_warn:
             findings.append(
                 Finding(
@@ -87,11 +89,18 @@ def run_class_distribution(
                 )
             )
 
-    train_dist = _distribution(split_counts.get("train", Counter()), class_count)
+    # Drift only applies when both splits have instances; checking the raw
+    # counts first avoids building class_count-long distributions for
+    # splits that are absent or empty.
+    train_counts = split_counts.get("train")
+    train_dist = _distribution(train_counts, class_count) if train_counts and any(train_counts) else None
     for target in ["val", "test"]:
-        target_dist = _distribution(split_counts.get(target, Counter()), class_count)
-        if not any(train_dist) or not any(target_dist):
+        if train_dist is None:
+            break
+        target_counts = split_counts.get(target)
+        if not target_counts or not any(target_counts):
             continue
+        target_dist = _distribution(target_counts, class_count)
         jsd = _jsd(train_dist, target_dist)
         if jsd >= split_drift_jsd_warn:
             findings.append(
@@ -111,5 +120,4 @@ def run_class_distribution(
                 )
             )
 
-    findings.sort(key=lambda f: (f.id, f.split or "", str(f.class_id) if f.class_id is not None else "", f.fingerprint))
-    return findings
+    return _sort_findings(findings)
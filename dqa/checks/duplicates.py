@@ -1,36 +1,43 @@
 from __future__ import annotations
 
-import hashlib
-from collections import defaultdict
 from typing import Any
 
 from ..models import Finding
+from .fingerprint import _fp
+from .ordering import _sort_findings
 
 
-def _fp(*parts: str) -> str:
-    raw = "|".join(parts).encode("utf-8")
-    return "sha1:" + hashlib.sha1(raw, usedforsecurity=False).hexdigest()
+_SPLIT_ORDER = ("test", "train", "val")
+_SPLIT_BIT = {name: 1 << index for index, name in enumerate(_SPLIT_ORDER)}
 
 
 def run_exact_duplicates(index_payload: dict[str, Any]) -> list[Finding]:
-    by_hash: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    # Group rows and fold each cluster's splits into a 3-bit mask in the
+    # same pass; split membership becomes bit math instead of set+sort.
+    split_bit = _SPLIT_BIT
+    by_hash: dict[str, list[Any]] = {}
     for row in index_payload.get("images", []):
-        sha = str(row.get("sha256", ""))
+        sha = row.get("sha256", "")
         if sha:
-            by_hash[sha].append(row)
+            bucket = by_hash.get(sha)
+            if bucket is None:
+                bucket = by_hash[sha] = [[], 0]
+            bucket[0].append(row)
+            bucket[1] |= split_bit.get(row.get("split", ""), 0)
 
     findings: list[Finding] = []
-    for sha, rows in by_hash.items():
+    for sha, (rows, mask) in by_hash.items():
         if len(rows) < 2:
             continue
-        splits = sorted({str(r.get("split", "")) for r in rows})
-        across = len(splits) > 1
+        # _SPLIT_ORDER is alphabetical, so this matches the old sorted() output.
+        splits = [name for name in _SPLIT_ORDER if mask & _SPLIT_BIT[name]]
+        across = (mask & (mask - 1)) != 0
         finding_id = "DUPLICATE_ACROSS_SPLITS" if across else "DUPLICATE_WITHIN_SPLIT"
         severity = "high" if across else "medium"
 
         for row in rows:
-            split = str(row.get("split", ""))
-            image = str(row.get("image", ""))
+            split = row.get("split", "")
+            image = row.get("image", "")
             findings.append(
                 Finding(
                     id=finding_id,
@@ -44,5 +51,4 @@ def run_exact_duplicates(index_payload: dict[str, Any]) -> list[Finding]:
                 )
             )
 
-    findings.sort(key=lambda f: (f.id, f.split or "", f.image or "", f.fingerprint))
-    return findings
+    return _sort_findings(findings)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import hashlib
+
+_blake2b = hashlib.blake2b
+
+
+def _fp(*parts: str) -> str:
+    """Stable, non-cryptographic fingerprint for finding deduplication.
+
+    Parts are ASCII in practice, so one str.join plus a single utf-8 pass
+    (a memcpy for ASCII) measures faster than joining per-part encodes.
+    """
+    return "b2:" + _blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
@@ -1,35 +1,36 @@
 from __future__ import annotations
 
-import hashlib
 from collections import defaultdict
 from typing import Any
 
 from ..models import Finding
-
-
-def _fp(*parts: str) -> str:
-    raw = "|".join(parts).encode("utf-8")
-    return "sha1:" + hashlib.sha1(raw, usedforsecurity=False).hexdigest()
+from .fingerprint import _fp
+from .ordering import _sort_findings
 
 
 def run_leakage(index_payload: dict[str, Any]) -> list[Finding]:
-    by_hash: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    # Bucket rows straight into per-split lists while grouping by hash,
+    # instead of re-filtering every cluster three times afterwards.
+    by_hash: dict[str, dict[str, list[dict[str, Any]]]] = defaultdict(
+        lambda: {"train": [], "val": [], "test": []}
+    )
     for row in index_payload.get("images", []):
-        sha = str(row.get("sha256", ""))
-        if sha:
-            by_hash[sha].append(row)
+        sha = row.get("sha256", "")
+        split = row.get("split", "")
+        if sha and split in {"train", "val", "test"}:
+            by_hash[sha][split].append(row)
 
     findings: list[Finding] = []
 
-    for sha, rows in by_hash.items():
-        train_rows = [r for r in rows if r.get("split") == "train"]
-        val_rows = [r for r in rows if r.get("split") == "val"]
-        test_rows = [r for r in rows if r.get("split") == "test"]
+    for sha, bucket in by_hash.items():
+        train_rows = bucket["train"]
+        val_rows = bucket["val"]
+        test_rows = bucket["test"]
 
         if train_rows and val_rows:
             for row in val_rows:
-                split = str(row.get("split", ""))
-                image = str(row.get("image", ""))
+                split = row.get("split", "")
+                image = row.get("image", "")
                 findings.append(
                     Finding(
                         id="LEAKAGE_EXACT_TRAIN_VAL",
@@ -40,7 +41,7 @@ def run_leakage(index_payload: dict[str, Any]) -> list[Finding]:
                         message="Exact train/val leakage detected.",
                         metrics={
                             "sha256": sha,
-                            "matching_train_images": [str(r.get("image", "")) for r in train_rows],
+                            "matching_train_images": [r.get("image", "") for r in train_rows],
                         },
                         fingerprint=_fp("LEAKAGE_EXACT_TRAIN_VAL", sha, split, image),
                     )
@@ -48,8 +49,8 @@ def run_leakage(index_payload: dict[str, Any]) -> list[Finding]:
 
         if train_rows and test_rows:
             for row in test_rows:
-                split = str(row.get("split", ""))
-                image = str(row.get("image", ""))
+                split = row.get("split", "")
+                image = row.get("image", "")
                 findings.append(
                     Finding(
                         id="LEAKAGE_EXACT_TRAIN_TEST",
@@ -60,11 +61,10 @@ def run_leakage(index_payload: dict[str, Any]) -> list[Finding]:
                         message="Exact train/test leakage detected.",
                         metrics={
                             "sha256": sha,
-                            "matching_train_images": [str(r.get("image", "")) for r in train_rows],
+                            "matching_train_images": [r.get("image", "") for r in train_rows],
                         },
                         fingerprint=_fp("LEAKAGE_EXACT_TRAIN_TEST", sha, split, image),
                     )
                 )
 
-    findings.sort(key=lambda f: (f.id, f.split or "", f.image or "", f.fingerprint))
-    return findings
+    return _sort_findings(findings)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import hashlib
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from ..models import Finding
+from .fingerprint import _fp
+from .ordering import _sort_findings
 
 try:
     from PIL import Image
@@ -13,19 +15,18 @@ except ModuleNotFoundError:  # pragma: no cover
     Image = None
 
 
-def _fp(*parts: str) -> str:
-    raw = "|".join(parts).encode("utf-8")
-    return "sha1:" + hashlib.sha1(raw, usedforsecurity=False).hexdigest()
-
-
 def _ahash(image_path: Path, size: int = 8) -> int:
     with Image.open(image_path) as img:  # type: ignore[union-attr]
-        gray = img.convert("L").resize((size, size))
-        pixels = list(gray.getdata())
+        # For JPEGs, draft() asks libjpeg for a scaled, luma-only decode
+        # (DCT-domain downscaling), skipping most IDCT and all chroma work;
+        # it is a no-op for other formats.
+        img.draft("L", (size, size))
+        gray = img.convert("L").resize((size, size), Image.Resampling.BOX)
+        pixels = gray.tobytes()
     avg = sum(pixels) / float(len(pixels))
     bits = 0
     for px in pixels:
-        bits = (bits << 1) | (1 if px >= avg else 0)
+        bits = (bits << 1) | (px >= avg)
     return bits
 
 
@@ -34,46 +35,44 @@ def _hamming_distance(a: int, b: int) -> int:
 
 
 def _candidate_pairs(hashes: list[int], threshold: int) -> list[tuple[int, int]]:
-    """Return every matching pair using an exact Hamming-distance BK-tree."""
+    """Return every matching pair using multi-index Hamming bucketing.
+
+    Splitting the 64-bit hash into ``threshold + 1`` bands guarantees (by
+    pigeonhole) that any pair within the threshold agrees exactly on at
+    least one band, so only hashes sharing a band bucket are compared.
+    """
     if threshold >= 64:
         return [(i, j) for i in range(len(hashes)) for j in range(i + 1, len(hashes))]
     if not hashes:
         return []
 
-    nodes: list[dict[str, Any]] = [{"value": hashes[0], "indices": [0], "children": {}}]
-    pairs: list[tuple[int, int]] = []
-
-    for index, value in enumerate(hashes[1:], start=1):
-        stack = [0]
-        while stack:
-            node_index = stack.pop()
-            node = nodes[node_index]
-            distance = _hamming_distance(value, int(node["value"]))
-            if distance <= threshold:
-                pairs.extend((other, index) for other in node["indices"])
-            lower = max(0, distance - threshold)
-            upper = min(64, distance + threshold)
-            stack.extend(
-                child
-                for edge, child in node["children"].items()
-                if lower <= edge <= upper
-            )
-
-        node_index = 0
-        while True:
-            node = nodes[node_index]
-            distance = _hamming_distance(value, int(node["value"]))
-            if distance == 0:
-                node["indices"].append(index)
-                break
-            child = node["children"].get(distance)
-            if child is None:
-                node["children"][distance] = len(nodes)
-                nodes.append({"value": value, "indices": [index], "children": {}})
-                break
-            node_index = child
-
-    return pairs
+    bands = threshold + 1
+    base_width, extra = divmod(64, bands)
+    layout: list[tuple[int, int]] = []
+    shift = 0
+    for band in range(bands):
+        width = base_width + (1 if band < extra else 0)
+        layout.append((shift, (1 << width) - 1))
+        shift += width
+
+    pairs: set[tuple[int, int]] = set()
+    for band, (shift, mask) in enumerate(layout):
+        buckets: dict[int, list[int]] = defaultdict(list)
+        for index, value in enumerate(hashes):
+            buckets[(value >> shift) & mask].append(index)
+        add_pair = pairs.add
+        for bucket in buckets.values():
+            if len(bucket) < 2:
+                continue
+            for pos, i in enumerate(bucket):
+                hash_i = hashes[i]
+                for j in bucket[pos + 1:]:
+                    # Inlined _hamming_distance: xor + native popcount, no
+                    # per-pair function call in the verification loop.
+                    if (hash_i ^ hashes[j]).bit_count() <= threshold:
+                        add_pair((i, j))
+
+    return sorted(pairs)
 
 
 def run_near_duplicates(
@@ -87,26 +86,31 @@ def run_near_duplicates(
     dataset_root = Path(str(index_payload.get("dataset_root", ".")))
 
     rows = index_payload.get("images", [])
-    readable: list[tuple[dict[str, Any], Path]] = []
-    for row in rows:
-        image_rel = str(row.get("image", ""))
-        image_abs = dataset_root / image_rel
-        readable.append((row, image_abs))
-
-    def hash_image(item: tuple[dict[str, Any], Path]) -> tuple[dict[str, Any], int] | None:
-        row, image_abs = item
+
+    # Rows sharing a sha256 are byte-identical, so one decode serves the
+    # whole cluster. Benign under threads: a racing miss just re-decodes.
+    ahash_by_sha: dict[str, int] = {}
+
+    def hash_image(row: dict[str, Any]) -> tuple[dict[str, Any], int] | None:
+        sha = row.get("sha256", "")
+        cached = ahash_by_sha.get(sha) if sha else None
+        if cached is not None:
+            return row, cached
         try:
-            h = _ahash(image_abs)
+            h = _ahash(dataset_root / row.get("image", ""))
         except OSError:
             return None
+        if sha:
+            ahash_by_sha[sha] = h
         return row, h
 
+    # PIL releases the GIL during decode, so threads scale the decode+hash
+    # phase; unreadable images drop out in the same pass.
     if workers > 1:
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            hashed = list(executor.map(hash_image, readable))
+        with ThreadPoolExecutor(max_workers=min(workers, 32)) as executor:
+            hashes = [item for item in executor.map(hash_image, rows) if item is not None]
     else:
-        hashed = [hash_image(item) for item in readable]
-    hashes = [item for item in hashed if item is not None]
+        hashes = [item for row in rows if (item := hash_image(row)) is not None]
 
     findings: list[Finding] = []
     candidates = _candidate_pairs([item[1] for item in hashes], phash_hamming_threshold)
@@ -119,10 +123,10 @@ def run_near_duplicates(
         if dist > phash_hamming_threshold:
             continue
 
-        split_i = str(row_i.get("split", ""))
-        split_j = str(row_j.get("split", ""))
-        image_i = str(row_i.get("image", ""))
-        image_j = str(row_j.get("image", ""))
+        split_i = row_i.get("split", "")
+        split_j = row_j.get("split", "")
+        image_i = row_i.get("image", "")
+        image_j = row_j.get("image", "")
 
         across = split_i != split_j
         finding_id = "NEAR_DUPLICATE_ACROSS_SPLITS" if across else "NEAR_DUPLICATE_WITHIN_SPLIT"
@@ -145,5 +149,4 @@ def run_near_duplicates(
             )
         )
 
-    findings.sort(key=lambda f: (f.id, f.split or "", f.image or "", f.fingerprint))
-    return findings, None
+    return _sort_findings(findings), None
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from operator import attrgetter
+
+from ..models import Finding
+
+_KEY_FIELDS = attrgetter("id", "split", "image", "label", "fingerprint")
+
+
+def _sort_findings(findings: list[Finding]) -> list[Finding]:
+    """Order findings deterministically via precomputed key tuples.
+
+    Decorate-sort-undecorate with plain tuples keeps the comparison loop
+    entirely in C instead of re-entering a key lambda per element; the
+    enumeration index breaks ties without ever comparing Finding objects.
+    A single attrgetter call fetches all five key fields per finding,
+    replacing five interpreted attribute lookups.
+    """
+    decorated = []
+    append = decorated.append
+    for i, finding in enumerate(findings):
+        fid, split, image, label, fingerprint = _KEY_FIELDS(finding)
+        append((fid, split or "", image or "", label or "", fingerprint, i))
+    decorated.sort()
+    return [findings[item[-1]] for item in decorated]
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from operator import itemgetter
+from typing import Any
+
+from ..models import Finding
+from .fingerprint import _fp
+from .ordering import _sort_findings
+
+# Precompiled row accessors: one C-level multi-key fetch instead of several
+# dict.get calls per label row. The indexer always writes these keys; the
+# KeyError fallbacks only fire for rows from pre-1.0 cached indexes.
+_ROW_IDS = itemgetter("class_id", "line")
+_ROW_BOX = itemgetter("x_center", "y_center", "width", "height")
+_ROW_WH = itemgetter("width", "height")
+
+
+def run_row_checks(
+    index_payload: dict[str, Any],
+    *,
+    integrity: bool = True,
+    bbox_sanity: bool = True,
+    class_count: int = 0,
+    min_box_area_ratio_warn: float = 0.0001,
+    max_box_area_ratio_warn: float = 0.90,
+    max_boxes_per_image_warn: int = 300,
+    aspect_ratio_warn: float = 20.0,
+) -> dict[str, list[Finding]]:
+    """Run the per-row checks (integrity, bbox sanity) in one fused pass.
+
+    Both checks walk ``images`` and every nested label row; visiting each
+    row once and dispatching to whichever checks are enabled halves the
+    iteration and dict-lookup cost when both run in the same audit.
+    """
+    integrity_findings: list[Finding] = []
+    bbox_findings: list[Finding] = []
+    integrity_append = integrity_findings.append
+    bbox_append = bbox_findings.append
+
+    for row in index_payload.get("images", []):
+        split = row.get("split", "")
+        image = row.get("image", "")
+        label = row.get("label")
+        label_rows = row.get("label_rows", [])
+
+        if integrity:
+            if not row.get("label_exists", False):
+                integrity_append(
+                    Finding(
+                        id="INTEGRITY_MISSING_LABEL",
+                        severity="high",
+                        message="Image has no matching label file.",
+                        split=split,
+                        image=image,
+                        label=None,
+                        fingerprint=_fp("INTEGRITY_MISSING_LABEL", split, image),
+                    )
+                )
+
+            image_error = row.get("image_error")
+            if image_error:
+                integrity_append(
+                    Finding(
+                        id="INTEGRITY_CORRUPT_IMAGE",
+                        severity="critical",
+                        message=f"Image could not be decoded: {image_error}",
+                        split=split,
+                        image=image,
+                        label=label,
+                        fingerprint=_fp("INTEGRITY_CORRUPT_IMAGE", split, image),
+                    )
+                )
+
+            for err in row.get("label_parse_errors", []):
+                line = int(err.get("line", 0))
+                reason = str(err.get("reason", "parse_error"))
+                integrity_append(
+                    Finding(
+                        id="INTEGRITY_MALFORMED_ROW",
+                        severity="high",
+                        message=f"Malformed label row at line {line}: {reason}",
+                        split=split,
+                        image=image,
+                        label=label,
+                        metrics={"line": line, "reason": reason},
+                        fingerprint=_fp("INTEGRITY_MALFORMED_ROW", split, image, str(line), reason),
+                    )
+                )
+
+        if bbox_sanity and len(label_rows) > max_boxes_per_image_warn:
+            bbox_append(
+                Finding(
+                    id="BBOX_TOO_MANY_PER_IMAGE",
+                    severity="medium",
+                    split=split,
+                    image=image,
+                    label=label,
+                    message="Image has more boxes than configured threshold.",
+                    metrics={"count": len(label_rows), "threshold": max_boxes_per_image_warn},
+                    fingerprint=_fp("BBOX_TOO_MANY_PER_IMAGE", split, image, str(len(label_rows))),
+                )
+            )
+
+        for parsed in label_rows:
+            class_id = -1
+            line = 0
+
+            if integrity:
+                try:
+                    class_id, line = _ROW_IDS(parsed)
+                except KeyError:
+                    class_id, line = parsed.get("class_id", -1), parsed.get("line", 0)
+                annotation_type = parsed.get("annotation_type", "bbox")
+
+                if class_id < 0 or class_id >= class_count:
+                    integrity_append(
+                        Finding(
+                            id="INTEGRITY_INVALID_CLASS_ID",
+                            severity="high",
+                            message=f"Class ID {class_id} is outside [0, {max(class_count - 1, 0)}].",
+                            split=split,
+                            image=image,
+                            label=label,
+                            class_id=class_id,
+                            metrics={"line": line},
+                            fingerprint=_fp("INTEGRITY_INVALID_CLASS_ID", split, image, str(line), str(class_id)),
+                        )
+                    )
+
+                if annotation_type == "segment":
+                    coords = parsed.get("coords", [])
+                    if not isinstance(coords, list):
+                        coords = []
+                    # min/max run in C; a generator would invoke float() per value.
+                    if coords and (min(coords) < 0.0 or max(coords) > 1.0):
+                        integrity_append(
+                            Finding(
+                                id="INTEGRITY_COORD_OUT_OF_RANGE",
+                                severity="high",
+                                message="Polygon values must be normalized to [0,1].",
+                                split=split,
+                                image=image,
+                                label=label,
+                                class_id=class_id if class_id >= 0 else None,
+                                metrics={"line": line, "annotation_type": "segment"},
+                                fingerprint=_fp("INTEGRITY_COORD_OUT_OF_RANGE", split, image, str(line)),
+                            )
+                        )
+                else:
+                    try:
+                        x_center, y_center, width, height = _ROW_BOX(parsed)
+                    except KeyError:
+                        x_center = parsed.get("x_center", 0.0)
+                        y_center = parsed.get("y_center", 0.0)
+                        width = parsed.get("width", 0.0)
+                        height = parsed.get("height", 0.0)
+                    if (
+                        not 0.0 <= x_center <= 1.0
+                        or not 0.0 <= y_center <= 1.0
+                        or not 0.0 <= width <= 1.0
+                        or not 0.0 <= height <= 1.0
+                    ):
+                        integrity_append(
+                            Finding(
+                                id="INTEGRITY_COORD_OUT_OF_RANGE",
+                                severity="high",
+                                message="BBox values must be normalized to [0,1].",
+                                split=split,
+                                image=image,
+                                label=label,
+                                class_id=class_id if class_id >= 0 else None,
+                                metrics={
+                                    "line": line,
+                                    "annotation_type": "bbox",
+                                    "x_center": x_center,
+                                    "y_center": y_center,
+                                    "width": width,
+                                    "height": height,
+                                },
+                                fingerprint=_fp("INTEGRITY_COORD_OUT_OF_RANGE", split, image, str(line)),
+                            )
+                        )
+
+            if bbox_sanity:
+                try:
+                    width, height = _ROW_WH(parsed)
+                except KeyError:
+                    width, height = parsed.get("width", 0.0), parsed.get("height", 0.0)
+                area = width * height
+
+                # Clean rows (the vast majority) take only the comparisons
+                # above; id coercions happen only once a threshold trips.
+                tiny = area < min_box_area_ratio_warn
+                oversized = area > max_box_area_ratio_warn
+                aspect = 0.0
+                if width > 0 and height > 0:
+                    aspect = width / height if width >= height else height / width
+                extreme_aspect = aspect > aspect_ratio_warn
+                if not (tiny or oversized or extreme_aspect):
+                    continue
+
+                if not integrity:
+                    try:
+                        class_id, line = _ROW_IDS(parsed)
+                    except KeyError:
+                        class_id, line = parsed.get("class_id", -1), parsed.get("line", 0)
+
+                if tiny:
+                    bbox_append(
+                        Finding(
+                            id="BBOX_TINY_BOX",
+                            severity="medium",
+                            split=split,
+                            image=image,
+                            label=label,
+                            class_id=class_id if class_id >= 0 else None,
+                            message="Bounding box area is below configured threshold.",
+                            metrics={"line": line, "area": area, "threshold": min_box_area_ratio_warn},
+                            fingerprint=_fp("BBOX_TINY_BOX", split, image, str(line)),
+                        )
+                    )
+
+                if oversized:
+                    bbox_append(
+                        Finding(
+                            id="BBOX_OVERSIZED_BOX",
+                            severity="medium",
+                            split=split,
+                            image=image,
+                            label=label,
+                            class_id=class_id if class_id >= 0 else None,
+                            message="Bounding box area is above configured threshold.",
+                            metrics={"line": line, "area": area, "threshold": max_box_area_ratio_warn},
+                            fingerprint=_fp("BBOX_OVERSIZED_BOX", split, image, str(line)),
+                        )
+                    )
+
+                if extreme_aspect:
+                    bbox_append(
+                        Finding(
+                            id="BBOX_EXTREME_ASPECT_RATIO",
+                            severity="medium",
+                            split=split,
+                            image=image,
+                            label=label,
+                            class_id=class_id if class_id >= 0 else None,
+                            message="Bounding box aspect ratio exceeds configured threshold.",
+                            metrics={"line": line, "aspect_ratio": aspect, "threshold": aspect_ratio_warn},
+                            fingerprint=_fp("BBOX_EXTREME_ASPECT_RATIO", split, image, str(line)),
+                        )
+                    )
+
+    if integrity:
+        for split_name, split_meta in index_payload.get("splits", {}).items():
+            for orphan_label in split_meta.get("orphan_labels", []):
+                integrity_append(
+                    Finding(
+                        id="INTEGRITY_ORPHAN_LABEL",
+                        severity="medium",
+                        message="Label file has no matching image file.",
+                        split=str(split_name),
+                        label=str(orphan_label),
+                        fingerprint=_fp("INTEGRITY_ORPHAN_LABEL", str(split_name), str(orphan_label)),
+                    )
+                )
+
+    return {
+        "integrity": _sort_findings(integrity_findings),
+        "bbox_sanity": _sort_findings(bbox_findings),
+    }
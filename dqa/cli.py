@@ -1,16 +1,28 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import os
 import sys
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from jsonschema import Draft202012Validator
 from jsonschema.exceptions import SchemaError as JsonSchemaError
 from jsonschema.exceptions import ValidationError as JsonValidationError
 
+try:
+    import fastjsonschema
+except ModuleNotFoundError:  # pragma: no cover
+    fastjsonschema = None
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 from .audit import AuditOptions, audit_dataset
 from .config import ConfigError
 from .io_yolo import DatasetSpecError
@@ -28,7 +40,10 @@ class ValidateError(ValueError):
     """Raised when validate inputs are invalid."""
 
 
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    # parse_args never mutates the parser, so repeat main() calls within
+    # one process (tests, embedding callers) reuse a single build.
     parser = argparse.ArgumentParser(prog="dqa", description="Dataset Quality Analyzer")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -56,7 +71,7 @@ def build_parser() -> argparse.ArgumentParser:
     explain.add_argument("--out-file", type=Path, default=None, help="Optional output file for explain content")
 
     validate = subparsers.add_parser("validate", help="Validate a DQA JSON artifact against a JSON schema")
-    validate.add_argument("--artifact", required=True, type=Path, help="Path to artifact JSON (e.g., summary.json)")
+    validate.add_argument("--artifact", required=True, type=Path, nargs="+", help="Path(s) to artifact JSON (e.g., summary.json)")
     validate.add_argument("--schema", required=True, type=Path, help="Path to JSON schema")
 
     diff = subparsers.add_parser("diff", help="Compare two DQA runs and show finding regressions")
@@ -67,20 +82,61 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+_SEV_CANON = {sev: sev for sev in ("critical", "high", "medium", "low")}
+
+
+def _canon_sev(value: object) -> str | None:
+    """Map a raw severity value to its canonical lowercase form.
+
+    Artifacts written by this tool already hold the lowercase literals, so
+    the common case is a single dict hit with no new string; only foreign
+    or oddly-cased values pay for str()/lower().
+    """
+    if isinstance(value, str):
+        canon = _SEV_CANON.get(value)
+        if canon is not None:
+            return canon
+        return _SEV_CANON.get(value.lower())
+    return _SEV_CANON.get(str(value).lower())
+
+
 def _counts_from_payload(findings: list[dict]) -> dict[str, int]:
     counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
     for row in findings:
-        sev = str(row.get("severity", "")).lower()
-        if sev in counts:
+        sev = _canon_sev(row.get("severity"))
+        if sev is not None:
             counts[sev] += 1
     return counts
 
 
+def _count_ids(rows: list[dict]) -> dict[str, int]:
+    # A tight dict.get loop beats Counter's from-iterable path for the
+    # small finding-id alphabet these payloads carry.
+    counts: dict[str, int] = {}
+    for row in rows:
+        key = row.get("id", "UNKNOWN")
+        if not isinstance(key, str):
+            key = str(key)
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def _top_ids(rows: list[dict], limit: int) -> list[tuple[str, int]]:
+    # Stable sort preserves first-seen order on ties, matching what
+    # Counter.most_common used to return.
+    return sorted(_count_ids(rows).items(), key=lambda kv: kv[1], reverse=True)[:limit]
+
+
 def _load_json(path: Path, expected_name: str) -> dict:
     if not path.exists():
         raise ExplainError(f"Missing {expected_name}: {path}")
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        if orjson is not None:
+            # orjson parses the raw bytes directly, skipping Python's
+            # text decode; its JSONDecodeError subclasses stdlib's.
+            payload = orjson.loads(path.read_bytes())
+        else:
+            payload = json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as exc:
         raise ExplainError(f"Invalid JSON in {expected_name}: {path}") from exc
     if not isinstance(payload, dict):
@@ -128,28 +184,43 @@ def run_explain(args: argparse.Namespace) -> int:
     if not isinstance(findings, list):
         raise ExplainError("flags.json must contain a 'findings' array.")
 
+    # One pass normalizes each severity once and partitions rows as it
+    # counts, instead of separate comprehensions re-lowercasing per row.
+    finding_rows = [f for f in findings if isinstance(f, dict)]
+    id_counts: dict[str, int] = {}
+    counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+    critical_or_high: list[dict] = []
+    medium_rows: list[dict] = []
+    for row in finding_rows:
+        key = row.get("id", "UNKNOWN")
+        if not isinstance(key, str):
+            key = str(key)
+        id_counts[key] = id_counts.get(key, 0) + 1
+        sev = _canon_sev(row.get("severity"))
+        if sev is not None:
+            counts[sev] += 1
+            if sev == "medium":
+                medium_rows.append(row)
+            elif sev != "low":
+                critical_or_high.append(row)
+
     totals = summary.get("totals", {})
     by_severity = totals.get("by_severity")
     if not isinstance(by_severity, dict):
-        by_severity = _counts_from_payload([f for f in findings if isinstance(f, dict)])
+        by_severity = counts
 
-    finding_rows = [f for f in findings if isinstance(f, dict)]
-    id_counts = Counter(str(f.get("id", "UNKNOWN")) for f in finding_rows)
-
-    top_finding_ids = id_counts.most_common(5)
-    critical_or_high = [f for f in finding_rows if str(f.get("severity", "")).lower() in {"critical", "high"}]
-    medium_rows = [f for f in finding_rows if str(f.get("severity", "")).lower() == "medium"]
+    top_finding_ids = sorted(id_counts.items(), key=lambda kv: kv[1], reverse=True)[:5]
 
     action_priority: list[str] = []
     if finding_rows:
         if critical_or_high:
-            top_ids = Counter(str(f.get("id", "UNKNOWN")) for f in critical_or_high).most_common(3)
+            top_ids = _top_ids(critical_or_high, 3)
             action_priority.extend([f"{finding_id}: {_recommendation_for_id(finding_id)}" for finding_id, _ in top_ids])
         elif medium_rows:
-            top_ids = Counter(str(f.get("id", "UNKNOWN")) for f in medium_rows).most_common(3)
+            top_ids = _top_ids(medium_rows, 3)
             action_priority.extend([f"{finding_id}: {_recommendation_for_id(finding_id)}" for finding_id, _ in top_ids])
         else:
-            top_ids = Counter(str(f.get("id", "UNKNOWN")) for f in finding_rows).most_common(3)
+            top_ids = _top_ids(finding_rows, 3)
             if set(fid for fid, _ in top_ids) == {"CLASS_LOW_SUPPORT"}:
                 action_priority.append("Low-severity only: increase samples for under-supported classes to improve robustness.")
             else:
@@ -258,10 +329,17 @@ def _parse_flags_findings(flags: dict) -> list[dict]:
 
 
 def run_diff(args: argparse.Namespace) -> int:
-    old_summary = _load_json(args.old / "summary.json", "summary.json")
-    old_flags = _load_json(args.old / "flags.json", "flags.json")
-    new_summary = _load_json(args.new / "summary.json", "summary.json")
-    new_flags = _load_json(args.new / "flags.json", "flags.json")
+    # The four artifact reads are independent, so issue them together and
+    # let the kernel overlap the I/O; this mostly pays off on cold caches
+    # (e.g. CI) where each serial open would eat a full disk round-trip.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(_load_json, args.old / "summary.json", "summary.json"),
+            pool.submit(_load_json, args.old / "flags.json", "flags.json"),
+            pool.submit(_load_json, args.new / "summary.json", "summary.json"),
+            pool.submit(_load_json, args.new / "flags.json", "flags.json"),
+        ]
+        old_summary, old_flags, new_summary, new_flags = [future.result() for future in futures]
 
     old_findings = _parse_flags_findings(old_flags)
     new_findings = _parse_flags_findings(new_flags)
@@ -279,8 +357,8 @@ def run_diff(args: argparse.Namespace) -> int:
         delta = new_by_sev[sev] - old_by_sev[sev]
         print(f"- {sev}: old={old_by_sev[sev]} new={new_by_sev[sev]} delta={delta:+d}")
 
-    old_id_counts = Counter(str(row.get("id", "UNKNOWN")) for row in old_findings)
-    new_id_counts = Counter(str(row.get("id", "UNKNOWN")) for row in new_findings)
+    old_id_counts = _count_ids(old_findings)
+    new_id_counts = _count_ids(new_findings)
 
     all_ids = sorted(set(old_id_counts.keys()) | set(new_id_counts.keys()))
     deltas = {finding_id: new_id_counts.get(finding_id, 0) - old_id_counts.get(finding_id, 0) for finding_id in all_ids}
@@ -288,23 +366,24 @@ def run_diff(args: argparse.Namespace) -> int:
     regressions = [(finding_id, delta) for finding_id, delta in deltas.items() if delta > 0]
     improvements = [(finding_id, delta) for finding_id, delta in deltas.items() if delta < 0]
 
-    regressions.sort(key=lambda row: row[1], reverse=True)
-    improvements.sort(key=lambda row: row[1])
+    # Only the top five are printed, so an O(N log 5) heap selection
+    # replaces fully sorting the delta lists; nlargest/nsmallest keep the
+    # same stable tie order as the sorts they replace.
+    top_regressions = heapq.nlargest(5, regressions, key=lambda row: row[1])
+    top_improvements = heapq.nsmallest(5, improvements, key=lambda row: row[1])
 
-    if regressions:
-        print("Top Regressions:")
-        for finding_id, delta in regressions[:5]:
+    print("Top Regressions:")
+    if top_regressions:
+        for finding_id, delta in top_regressions:
             print(f"- {finding_id}: +{delta}")
     else:
-        print("Top Regressions:")
         print("- none")
 
-    if improvements:
-        print("Top Improvements:")
-        for finding_id, delta in improvements[:5]:
+    print("Top Improvements:")
+    if top_improvements:
+        for finding_id, delta in top_improvements:
             print(f"- {finding_id}: {delta}")
     else:
-        print("Top Improvements:")
         print("- none")
 
     if args.fail_on_regression is None:
@@ -349,32 +428,62 @@ def run_audit(args: argparse.Namespace) -> int:
     print(f"build_failed={totals['build_failed']}")
     return result.exit_code
 
-def run_validate(args: argparse.Namespace) -> int:
-    artifact = args.artifact
-    schema = args.schema
-
-    artifact_payload = _load_json(artifact, "artifact JSON")
-    schema_payload = _load_json(schema, "schema JSON")
+@lru_cache(maxsize=32)
+def _compiled_validator(schema_path: str, mtime_ns: int) -> tuple[Draft202012Validator, object | None]:
+    """Load, check, and compile a schema, cached on (path, mtime).
 
+    Validator construction walks the whole schema and builds sub-validators;
+    caching on the file's mtime amortizes that across artifacts validated
+    against the same schema file.
+    """
+    schema_payload = _load_json(Path(schema_path), "schema JSON")
     try:
         Draft202012Validator.check_schema(schema_payload)
         validator = Draft202012Validator(schema_payload)
     except JsonSchemaError as exc:
-        raise ValidateError(f"Invalid JSON schema: {schema}") from exc
+        raise ValidateError(f"Invalid JSON schema: {schema_path}") from exc
+    # fastjsonschema code-generates a plain validation function that is an
+    # order of magnitude faster on large artifacts; it only answers
+    # pass/fail here, with jsonschema kept for structured error listings.
+    fast_validate = None
+    if fastjsonschema is not None:
+        try:
+            fast_validate = fastjsonschema.compile(schema_payload)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            fast_validate = None
+    return validator, fast_validate
 
-    errors = sorted(validator.iter_errors(artifact_payload), key=lambda e: list(e.absolute_path))
-
-    if not errors:
-        print(f"valid artifact={artifact.as_posix()} schema={schema.as_posix()}")
-        return 0
 
-    print(f"invalid artifact={artifact.as_posix()} schema={schema.as_posix()}", file=sys.stderr)
-    for err in errors[:10]:
-        path = ".".join(str(part) for part in err.absolute_path) or "$"
-        print(f"- {path}: {err.message}", file=sys.stderr)
-    if len(errors) > 10:
-        print(f"- ... and {len(errors) - 10} more validation error(s)", file=sys.stderr)
-    return 1
+def run_validate(args: argparse.Namespace) -> int:
+    schema = args.schema
+    mtime_ns = schema.stat().st_mtime_ns if schema.exists() else 0
+    validator, fast_validate = _compiled_validator(str(schema), mtime_ns)
+
+    exit_code = 0
+    for artifact in args.artifact:
+        artifact_payload = _load_json(artifact, "artifact JSON")
+        if fast_validate is not None:
+            try:
+                fast_validate(artifact_payload)
+            except fastjsonschema.JsonSchemaException:
+                pass  # re-validate below for the detailed error listing
+            else:
+                print(f"valid artifact={artifact.as_posix()} schema={schema.as_posix()}")
+                continue
+        errors = sorted(validator.iter_errors(artifact_payload), key=lambda e: list(e.absolute_path))
+
+        if not errors:
+            print(f"valid artifact={artifact.as_posix()} schema={schema.as_posix()}")
+            continue
+
+        exit_code = 1
+        print(f"invalid artifact={artifact.as_posix()} schema={schema.as_posix()}", file=sys.stderr)
+        for err in errors[:10]:
+            path = ".".join(str(part) for part in err.absolute_path) or "$"
+            print(f"- {path}: {err.message}", file=sys.stderr)
+        if len(errors) > 10:
+            print(f"- ... and {len(errors) - 10} more validation error(s)", file=sys.stderr)
+    return exit_code
 
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
@@ -8,6 +8,12 @@ try:
     import yaml
 except ModuleNotFoundError:  # pragma: no cover
     yaml = None
+    _YamlLoader = None
+else:
+    # libyaml's C loader parses ~10x faster than the pure-Python
+    # SafeLoader and applies the same safe construction rules; wheels
+    # without libyaml fall back transparently.
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 Severity = Literal["critical", "high", "medium", "low"]
 
@@ -16,12 +22,12 @@ class ConfigError(ValueError):
     """Raised when configuration is invalid."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntegrityConfig:
     enabled: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClassDistributionConfig:
     enabled: bool = True
     min_instances_per_class_warn: int = 50
@@ -30,7 +36,7 @@ class ClassDistributionConfig:
     split_drift_jsd_high: float = 0.20
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BBoxSanityConfig:
     enabled: bool = True
     min_box_area_ratio_warn: float = 0.0001
@@ -39,23 +45,23 @@ class BBoxSanityConfig:
     aspect_ratio_warn: float = 20.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DuplicatesConfig:
     enabled: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NearDuplicatesConfig:
     enabled: bool = False
     phash_hamming_threshold: int = 8
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LeakageConfig:
     enabled: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChecksConfig:
     integrity: IntegrityConfig
     class_distribution: ClassDistributionConfig
@@ -65,7 +71,7 @@ class ChecksConfig:
     leakage: LeakageConfig
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DQAConfig:
     version: int
     fail_on: Severity
@@ -114,100 +120,87 @@ def _as_float(name: str, value: Any) -> float:
     return float(value)
 
 
-def _parse_integrity(payload: dict[str, Any]) -> IntegrityConfig:
-    _reject_unknown_keys("checks.integrity", payload, {"enabled"})
-    return IntegrityConfig(enabled=_as_bool("checks.integrity.enabled", payload.get("enabled", True)))
-
-
-def _parse_class_distribution(payload: dict[str, Any]) -> ClassDistributionConfig:
-    _reject_unknown_keys(
-        "checks.class_distribution",
-        payload,
+# Declarative per-section schema: field -> (coercion type, default).
+# One generic parser walks these tables instead of six hand-rolled
+# near-identical functions; key sets are frozen once at import so the
+# unknown-key check does no per-call set construction.
+_SECTION_FIELDS: dict[str, tuple[type, dict[str, tuple[type, Any]]]] = {
+    "integrity": (IntegrityConfig, {"enabled": (bool, True)}),
+    "class_distribution": (
+        ClassDistributionConfig,
         {
-            "enabled",
-            "min_instances_per_class_warn",
-            "max_class_share_warn",
-            "split_drift_jsd_warn",
-            "split_drift_jsd_high",
+            "enabled": (bool, True),
+            "min_instances_per_class_warn": (int, 50),
+            "max_class_share_warn": (float, 0.80),
+            "split_drift_jsd_warn": (float, 0.10),
+            "split_drift_jsd_high": (float, 0.20),
         },
-    )
-    return ClassDistributionConfig(
-        enabled=_as_bool("checks.class_distribution.enabled", payload.get("enabled", True)),
-        min_instances_per_class_warn=_as_int(
-            "checks.class_distribution.min_instances_per_class_warn",
-            payload.get("min_instances_per_class_warn", 50),
-        ),
-        max_class_share_warn=_as_float(
-            "checks.class_distribution.max_class_share_warn", payload.get("max_class_share_warn", 0.80)
-        ),
-        split_drift_jsd_warn=_as_float(
-            "checks.class_distribution.split_drift_jsd_warn", payload.get("split_drift_jsd_warn", 0.10)
-        ),
-        split_drift_jsd_high=_as_float(
-            "checks.class_distribution.split_drift_jsd_high", payload.get("split_drift_jsd_high", 0.20)
-        ),
-    )
-
-
-def _parse_bbox_sanity(payload: dict[str, Any]) -> BBoxSanityConfig:
-    _reject_unknown_keys(
-        "checks.bbox_sanity",
-        payload,
+    ),
+    "bbox_sanity": (
+        BBoxSanityConfig,
         {
-            "enabled",
-            "min_box_area_ratio_warn",
-            "max_box_area_ratio_warn",
-            "max_boxes_per_image_warn",
-            "aspect_ratio_warn",
+            "enabled": (bool, True),
+            "min_box_area_ratio_warn": (float, 0.0001),
+            "max_box_area_ratio_warn": (float, 0.90),
+            "max_boxes_per_image_warn": (int, 300),
+            "aspect_ratio_warn": (float, 20.0),
         },
-    )
-    return BBoxSanityConfig(
-        enabled=_as_bool("checks.bbox_sanity.enabled", payload.get("enabled", True)),
-        min_box_area_ratio_warn=_as_float(
-            "checks.bbox_sanity.min_box_area_ratio_warn", payload.get("min_box_area_ratio_warn", 0.0001)
-        ),
-        max_box_area_ratio_warn=_as_float(
-            "checks.bbox_sanity.max_box_area_ratio_warn", payload.get("max_box_area_ratio_warn", 0.90)
-        ),
-        max_boxes_per_image_warn=_as_int(
-            "checks.bbox_sanity.max_boxes_per_image_warn", payload.get("max_boxes_per_image_warn", 300)
-        ),
-        aspect_ratio_warn=_as_float("checks.bbox_sanity.aspect_ratio_warn", payload.get("aspect_ratio_warn", 20.0)),
-    )
+    ),
+    "duplicates": (DuplicatesConfig, {"enabled": (bool, True)}),
+    "near_duplicates": (
+        NearDuplicatesConfig,
+        {"enabled": (bool, False), "phash_hamming_threshold": (int, 8)},
+    ),
+    "leakage": (LeakageConfig, {"enabled": (bool, True)}),
+}
 
+_SECTION_KEYS: dict[str, frozenset[str]] = {
+    name: frozenset(fields) for name, (_, fields) in _SECTION_FIELDS.items()
+}
 
-def _parse_duplicates(payload: dict[str, Any]) -> DuplicatesConfig:
-    _reject_unknown_keys("checks.duplicates", payload, {"enabled"})
-    return DuplicatesConfig(enabled=_as_bool("checks.duplicates.enabled", payload.get("enabled", True)))
+_COERCE = {bool: _as_bool, int: _as_int, float: _as_float}
 
+# Bounds that go beyond type coercion: (section, field) -> (min, max).
+_RANGE_LIMITS: dict[tuple[str, str], tuple[int, int]] = {
+    ("near_duplicates", "phash_hamming_threshold"): (0, 64),
+}
 
-def _parse_near_duplicates(payload: dict[str, Any]) -> NearDuplicatesConfig:
-    _reject_unknown_keys("checks.near_duplicates", payload, {"enabled", "phash_hamming_threshold"})
-    threshold = _as_int(
-        "checks.near_duplicates.phash_hamming_threshold", payload.get("phash_hamming_threshold", 8)
-    )
-    if not 0 <= threshold <= 64:
-        raise ConfigError("checks.near_duplicates.phash_hamming_threshold must be between 0 and 64")
-    return NearDuplicatesConfig(
-        enabled=_as_bool("checks.near_duplicates.enabled", payload.get("enabled", False)),
-        phash_hamming_threshold=threshold,
-    )
+
+def _parse_section(name: str, payload: dict[str, Any]) -> Any:
+    cls, fields = _SECTION_FIELDS[name]
+    qualified = f"checks.{name}"
+    _reject_unknown_keys(qualified, payload, _SECTION_KEYS[name])
+    parsed: dict[str, Any] = {}
+    for field, (kind, default) in fields.items():
+        value = _COERCE[kind](f"{qualified}.{field}", payload.get(field, default))
+        limits = _RANGE_LIMITS.get((name, field))
+        if limits is not None and not limits[0] <= value <= limits[1]:
+            raise ConfigError(f"{qualified}.{field} must be between {limits[0]} and {limits[1]}")
+        parsed[field] = value
+    return cls(**parsed)
 
 
-def _parse_leakage(payload: dict[str, Any]) -> LeakageConfig:
-    _reject_unknown_keys("checks.leakage", payload, {"enabled"})
-    return LeakageConfig(enabled=_as_bool("checks.leakage.enabled", payload.get("enabled", True)))
+# Parsed configs keyed by (path, mtime_ns, size); DQAConfig is frozen,
+# so warm calls can hand back the shared instance without re-parsing.
+_config_cache: dict[tuple[str, int, int], DQAConfig] = {}
 
 
 def load_config(path: Path | None = None) -> DQAConfig:
     if yaml is None:
         raise ConfigError("PyYAML is required to load dqa.yaml. Install with: pip install pyyaml")
+    cache_key: tuple[str, int, int] | None = None
     if path is None:
         raw: Any = {"version": 1, "fail_on": "high", "checks": {}}
     else:
-        if not path.exists():
-            raise ConfigError(f"Config file not found: {path}")
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        try:
+            st = path.stat()
+        except OSError:
+            raise ConfigError(f"Config file not found: {path}") from None
+        cache_key = (str(path), st.st_mtime_ns, st.st_size)
+        cached = _config_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        raw = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
     root = _expect_dict("config", raw or {})
 
     _reject_unknown_keys("config", root, _EXPECTED_TOP_KEYS)
@@ -221,16 +214,13 @@ def load_config(path: Path | None = None) -> DQAConfig:
     _reject_unknown_keys("checks", checks_raw, _EXPECTED_CHECK_KEYS)
 
     checks = ChecksConfig(
-        integrity=_parse_integrity(_expect_dict("checks.integrity", checks_raw.get("integrity", {}))),
-        class_distribution=_parse_class_distribution(
-            _expect_dict("checks.class_distribution", checks_raw.get("class_distribution", {}))
-        ),
-        bbox_sanity=_parse_bbox_sanity(_expect_dict("checks.bbox_sanity", checks_raw.get("bbox_sanity", {}))),
-        duplicates=_parse_duplicates(_expect_dict("checks.duplicates", checks_raw.get("duplicates", {}))),
-        near_duplicates=_parse_near_duplicates(
-            _expect_dict("checks.near_duplicates", checks_raw.get("near_duplicates", {}))
-        ),
-        leakage=_parse_leakage(_expect_dict("checks.leakage", checks_raw.get("leakage", {}))),
+        **{
+            name: _parse_section(name, _expect_dict(f"checks.{name}", checks_raw.get(name, {})))
+            for name in _SECTION_FIELDS
+        }
     )
 
-    return DQAConfig(version=version, fail_on=fail_on, checks=checks)
+    config = DQAConfig(version=version, fail_on=fail_on, checks=checks)
+    if cache_key is not None:
+        _config_cache[cache_key] = config
+    return config
@@ -2,19 +2,33 @@ from __future__ import annotations
 
 import hashlib
 import json
-import struct
+import mmap
+import os
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 from .io_yolo import DatasetSpec, DatasetSpecError
 
 _IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
 
+# SOF0-SOF15 minus DHT/DAC/JPG (C4, C8, CC), plus the standalone markers
+# that carry no length word; hoisted so the scan loop does not rebuild
+# them per marker.
+_JPEG_SOF_MARKERS = frozenset(
+    {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+)
+_JPEG_SKIP_MARKERS = frozenset({0xD8, 0xD9})
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuildIndexResult:
     payload: dict[str, Any]
     class_count: int
@@ -22,6 +36,43 @@ class BuildIndexResult:
     cache_misses: int = 0
 
 
+def _scan_labels(root: Path) -> tuple[dict[str, os.stat_result | None], list[Path]]:
+    """Collect label files under ``root`` in one scandir pass.
+
+    Returns ``(by_stem, all_labels)``: ``by_stem`` maps the stem of each
+    ``.txt`` file sitting directly in ``root`` (the only location YOLO
+    label matching consults) to its cached stat result, and
+    ``all_labels`` holds every ``.txt`` path found recursively so orphan
+    detection still sees files in nested directories.
+    """
+    by_stem: dict[str, os.stat_result | None] = {}
+    all_labels: list[Path] = []
+    root_str = str(root)
+    stack = [root_str]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if entry.is_file() and entry.name.endswith(".txt"):
+                        all_labels.append(Path(entry.path))
+                        if current == root_str:
+                            try:
+                                entry_stat = entry.stat()
+                            except OSError:
+                                entry_stat = None
+                            by_stem[entry.name[:-4]] = entry_stat
+                except OSError:
+                    continue
+    return by_stem, all_labels
+
 def _previous_rows(previous_index: dict[str, Any] | None, dataset_root: Path) -> dict[tuple[str, str], dict[str, Any]]:
     if not previous_index or previous_index.get("dataset_root") != dataset_root.as_posix():
         return {}
@@ -38,8 +89,9 @@ def _previous_rows(previous_index: dict[str, Any] | None, dataset_root: Path) ->
 def _read_png_size(data: bytes) -> tuple[int, int]:
     if len(data) < 24 or not data.startswith(b"\x89PNG\r\n\x1a\n"):
         raise ValueError("invalid png")
-    width, height = struct.unpack(">II", data[16:24])
-    return int(width), int(height)
+    width = int.from_bytes(data[16:20], "big")
+    height = int.from_bytes(data[20:24], "big")
+    return width, height
 
 
 def _read_jpeg_size(data: bytes) -> tuple[int, int]:
@@ -47,24 +99,28 @@ def _read_jpeg_size(data: bytes) -> tuple[int, int]:
         raise ValueError("invalid jpeg")
     idx = 2
     data_len = len(data)
-    while idx + 9 < data_len:
-        if data[idx] != 0xFF:
-            idx += 1
-            continue
+    while True:
+        # bytes.find dispatches to memchr, so skipping entropy-coded data
+        # between markers costs one C scan instead of a Python iteration
+        # per byte.
+        idx = data.find(b"\xff", idx)
+        if idx < 0 or idx + 9 >= data_len:
+            break
         marker = data[idx + 1]
         idx += 2
-        if marker in {0xD8, 0xD9}:
+        if marker in _JPEG_SKIP_MARKERS:
             continue
         if idx + 2 > data_len:
             break
-        seg_len = struct.unpack(">H", data[idx:idx + 2])[0]
+        seg_len = int.from_bytes(data[idx:idx + 2], "big")
         if seg_len < 2 or idx + seg_len > data_len:
             break
-        if marker in {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}:
+        if marker in _JPEG_SOF_MARKERS:
             if idx + 7 > data_len:
                 break
-            height, width = struct.unpack(">HH", data[idx + 3:idx + 7])
-            return int(width), int(height)
+            height = int.from_bytes(data[idx + 3:idx + 5], "big")
+            width = int.from_bytes(data[idx + 5:idx + 7], "big")
+            return width, height
         idx += seg_len
     raise ValueError("jpeg size parse failed")
 
@@ -90,25 +146,35 @@ def _image_dimensions(path: Path) -> tuple[int | None, int | None, str | None]:
 
 
 def _sha256_file(path: Path) -> str:
-    hasher = hashlib.sha256()
-    with path.open("rb") as f:
-        while True:
-            block = f.read(1024 * 1024)
-            if not block:
-                break
-            hasher.update(block)
-    return hasher.hexdigest()
+    # Hash straight from a shared mapping: the file is paged in once and
+    # OpenSSL consumes the buffer without a userspace read loop.
+    # MADV_SEQUENTIAL lets the kernel read ahead of the hasher and drop
+    # pages behind it.
+    with path.open("rb", buffering=0) as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files cannot be mapped; stream those through the
+            # C-level file_digest loop instead.
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        with mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return hashlib.sha256(mm).hexdigest()
 
 
 def _parse_label_rows(path: Path) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     rows: list[dict[str, Any]] = []
     errors: list[dict[str, Any]] = []
+    append_row = rows.append
+    append_error = errors.append
     text = path.read_text(encoding="utf-8", errors="replace")
+    # split() tokenizes and skips surrounding whitespace in one go, so no
+    # per-line strip() copy is needed before it.
     for line_no, raw_line in enumerate(text.splitlines(), start=1):
-        line = raw_line.strip()
-        if not line:
+        parts = raw_line.split()
+        if not parts:
             continue
-        parts = line.split()
 
         if len(parts) == 5:
             try:
@@ -118,9 +184,9 @@ def _parse_label_rows(path: Path) -> tuple[list[dict[str, Any]], list[dict[str,
                 width = float(parts[3])
                 height = float(parts[4])
             except ValueError:
-                errors.append({"line": line_no, "raw": raw_line, "reason": "non_numeric"})
+                append_error({"line": line_no, "raw": raw_line, "reason": "non_numeric"})
                 continue
-            rows.append(
+            append_row(
                 {
                     "line": line_no,
                     "annotation_type": "bbox",
@@ -137,13 +203,15 @@ def _parse_label_rows(path: Path) -> tuple[list[dict[str, Any]], list[dict[str,
         if len(parts) >= 7 and len(parts) % 2 == 1:
             try:
                 class_id = int(parts[0])
-                coords = [float(v) for v in parts[1:]]
+                # map(float, ...) runs the conversion loop in C instead
+                # of bytecode-per-token, the hot path for polygon rows.
+                coords = list(map(float, parts[1:]))
             except ValueError:
-                errors.append({"line": line_no, "raw": raw_line, "reason": "non_numeric"})
+                append_error({"line": line_no, "raw": raw_line, "reason": "non_numeric"})
                 continue
 
             if len(coords) < 6:
-                errors.append({"line": line_no, "raw": raw_line, "reason": "min_polygon_points"})
+                append_error({"line": line_no, "raw": raw_line, "reason": "min_polygon_points"})
                 continue
 
             xs = coords[0::2]
@@ -151,7 +219,7 @@ def _parse_label_rows(path: Path) -> tuple[list[dict[str, Any]], list[dict[str,
             x_min, x_max = min(xs), max(xs)
             y_min, y_max = min(ys), max(ys)
 
-            rows.append(
+            append_row(
                 {
                     "line": line_no,
                     "annotation_type": "segment",
@@ -166,69 +234,134 @@ def _parse_label_rows(path: Path) -> tuple[list[dict[str, Any]], list[dict[str,
             )
             continue
 
-        errors.append({"line": line_no, "raw": raw_line, "reason": "expected_5_tokens_or_valid_polygon"})
+        append_error({"line": line_no, "raw": raw_line, "reason": "expected_5_tokens_or_valid_polygon"})
 
     return rows, errors
 
 
+def _cache_digest(rows: list[dict[str, Any]]) -> str:
+    """Digest of per-image identity lines, fed to SHA-256 incrementally.
+
+    Joining the lines first would materialize the whole basis string
+    (O(images) bytes) just to hash it; streaming per row keeps the same
+    digest with constant extra memory.
+    """
+    hasher = hashlib.sha256()
+    update = hasher.update
+    for index, row in enumerate(rows):
+        if index:
+            update(b"\n")
+        update(f"{row['image']}|{row['size_bytes']}|{row['mtime_ns']}|{row['sha256']}".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _scan_images(root: Path) -> list[tuple[Path, os.stat_result | None]]:
+    """Recursively collect image files under ``root`` in sorted order.
+
+    os.scandir surfaces the file type from the directory read itself and
+    caches the stat result on the DirEntry, so enumeration costs one
+    syscall per directory instead of one stat per file the way
+    rglob("*") + is_file() + stat() did.
+    """
+    found: list[tuple[Path, os.stat_result | None]] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTS:
+                        try:
+                            entry_stat = entry.stat()
+                        except OSError:
+                            entry_stat = None
+                        found.append((Path(entry.path), entry_stat))
+                except OSError:
+                    continue
+    # Sort by the root-relative posix string: that is the ordering the
+    # (split, image) rows promise, and the native path string is not a
+    # stand-in for it on Windows, where "\\" ranks differently from "/"
+    # once images sit in nested subdirectories.
+    found.sort(key=lambda item: item[0].relative_to(root).as_posix())
+    return found
+
+
+def _probe_image(
+    image_path: Path, label_path: Path | None, need_hash: bool = True
+) -> tuple[int | None, int | None, str | None, str, list[dict[str, Any]], list[dict[str, Any]]]:
+    """Per-image work for a cache miss: dimensions, hash, label parse.
+
+    Bundled into one function so a worker thread handles everything the
+    miss needs; the file reads release the GIL, letting workers overlap.
+    """
+    width, height, image_error = _image_dimensions(image_path)
+    sha256 = _sha256_file(image_path) if need_hash else ""
+    label_rows: list[dict[str, Any]] = []
+    parse_errors: list[dict[str, Any]] = []
+    if label_path is not None:
+        try:
+            label_rows, parse_errors = _parse_label_rows(label_path)
+        except OSError as exc:
+            parse_errors = [{"line": 0, "raw": "", "reason": f"read_error:{exc}"}]
+    return width, height, image_error, sha256, label_rows, parse_errors
+
+
 def build_index(
     spec: DatasetSpec,
     max_images: int = 0,
     previous_index: dict[str, Any] | None = None,
     workers: int = 1,
+    need_content_hash: bool = True,
 ) -> BuildIndexResult:
     images: list[dict[str, Any]] = []
     split_stats: dict[str, dict[str, Any]] = {}
     cached_rows = _previous_rows(previous_index, spec.root)
     cache_hits = 0
     cache_misses = 0
-    hash_executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
-    hash_futures: dict[tuple[str, str], Future[str]] = {}
+    probe_executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    probe_futures: dict[tuple[str, str], Future[tuple[Any, ...]]] = {}
 
     total_seen = 0
     for split_name in sorted(spec.splits):
         split = spec.splits[split_name]
-        split_images: list[Path] = []
-        if split.images_dir.exists() and split.images_dir.is_dir():
-            split_images = sorted(
-                p for p in split.images_dir.rglob("*") if p.is_file() and p.suffix.lower() in _IMAGE_EXTS
-            )
-
-        label_set: set[Path] = set()
-        if split.labels_dir.exists() and split.labels_dir.is_dir():
-            label_set = {p.resolve() for p in split.labels_dir.rglob("*.txt") if p.is_file()}
+        split_images = _scan_images(split.images_dir)
 
-        matched_labels: set[Path] = set()
+        labels_by_stem, all_labels = _scan_labels(split.labels_dir)
+        matched_stems: set[str] = set()
 
-        for image_path in split_images:
+        for image_path, image_stat in split_images:
             if max_images > 0 and total_seen >= max_images:
                 break
             total_seen += 1
 
             image_rel = image_path.relative_to(spec.root).as_posix()
-            label_path = split.labels_dir / f"{image_path.stem}.txt"
-            label_exists = label_path.exists() and label_path.is_file()
+            stem = image_path.stem
+            label_path = split.labels_dir / f"{stem}.txt"
+            label_exists = stem in labels_by_stem
 
             if label_exists:
-                matched_labels.add(label_path.resolve())
+                matched_stems.add(stem)
 
-            try:
-                stat = image_path.stat()
-                size_bytes = int(stat.st_size)
-                mtime_ns = int(stat.st_mtime_ns)
-            except OSError:
+            if image_stat is not None:
+                size_bytes = int(image_stat.st_size)
+                mtime_ns = int(image_stat.st_mtime_ns)
+            else:
                 size_bytes = -1
                 mtime_ns = -1
 
             label_size_bytes = -1
             label_mtime_ns = -1
             if label_exists:
-                try:
-                    label_stat = label_path.stat()
+                label_stat = labels_by_stem[stem]
+                if label_stat is not None:
                     label_size_bytes = int(label_stat.st_size)
                     label_mtime_ns = int(label_stat.st_mtime_ns)
-                except OSError:
-                    pass
 
             cached = cached_rows.get((split_name, image_rel))
             cache_valid = bool(
@@ -238,6 +371,10 @@ def build_index(
                 and cached.get("label_exists") == label_exists
                 and cached.get("label_size_bytes", -1) == label_size_bytes
                 and cached.get("label_mtime_ns", -1) == label_mtime_ns
+                # A row written by a hash-skipping run carries sha256="";
+                # reusing it when this run needs content hashes would
+                # blind the duplicate/leakage checks.
+                and (not need_content_hash or cached.get("sha256"))
             )
 
             label_rows: list[dict[str, Any]] = []
@@ -252,18 +389,20 @@ def build_index(
                 parse_errors = list(cached.get("label_parse_errors", []))
             else:
                 cache_misses += 1
-                width, height, image_error = _image_dimensions(image_path)
-                if hash_executor is None:
-                    sha256 = _sha256_file(image_path)
+                if probe_executor is None:
+                    width, height, image_error = _image_dimensions(image_path)
+                    sha256 = _sha256_file(image_path) if need_content_hash else ""
+                    if label_exists:
+                        try:
+                            label_rows, parse_errors = _parse_label_rows(label_path)
+                        except OSError as exc:
+                            parse_errors = [{"line": 0, "raw": "", "reason": f"read_error:{exc}"}]
                 else:
+                    width = height = image_error = None
                     sha256 = ""
-                    hash_futures[(split_name, image_rel)] = hash_executor.submit(_sha256_file, image_path)
-
-            if label_exists and not cache_valid:
-                try:
-                    label_rows, parse_errors = _parse_label_rows(label_path)
-                except OSError as exc:
-                    parse_errors = [{"line": 0, "raw": "", "reason": f"read_error:{exc}"}]
+                    probe_futures[(split_name, image_rel)] = probe_executor.submit(
+                        _probe_image, image_path, label_path if label_exists else None, need_content_hash
+                    )
 
             images.append(
                 {
@@ -286,8 +425,8 @@ def build_index(
 
         orphan_labels = sorted(
             p.relative_to(spec.root).as_posix()
-            for p in label_set
-            if p not in matched_labels
+            for p in all_labels
+            if not (p.stem in matched_stems and p.parent == split.labels_dir)
         )
 
         split_stats[split_name] = {
@@ -300,19 +439,24 @@ def build_index(
         if max_images > 0 and total_seen >= max_images:
             break
 
-    images.sort(key=lambda x: (x["split"], x["image"]))
-
+    # Splits are visited in sorted name order and _scan_images returns each
+    # split's files sorted, so the concatenated list is already in
+    # (split, image) order and needs no final O(n log n) pass.
     for row in images:
-        future = hash_futures.get((str(row["split"]), str(row["image"])))
+        future = probe_futures.get((str(row["split"]), str(row["image"])))
         if future is not None:
-            row["sha256"] = future.result()
-    if hash_executor is not None:
-        hash_executor.shutdown()
-
-    cache_basis = []
-    for row in images:
-        cache_basis.append(f"{row['image']}|{row['size_bytes']}|{row['mtime_ns']}|{row['sha256']}")
-    digest = hashlib.sha256("\n".join(cache_basis).encode("utf-8")).hexdigest()
+            width, height, image_error, sha256, label_rows, parse_errors = future.result()
+            row["width"] = width
+            row["height"] = height
+            row["image_error"] = image_error
+            row["sha256"] = sha256
+            if row["label_exists"]:
+                row["label_rows"] = label_rows
+                row["label_parse_errors"] = parse_errors
+    if probe_executor is not None:
+        probe_executor.shutdown()
+
+    digest = _cache_digest(images)
 
     payload = {
         "schema_version": "1.0.0",
@@ -388,6 +532,7 @@ def build_index_from_coco(
     max_images: int = 0,
     previous_index: dict[str, Any] | None = None,
     workers: int = 1,
+    need_content_hash: bool = True,
 ) -> BuildIndexResult:
     root, split_files = _discover_coco_files(source)
     include_splits = set(requested_splits or ["train", "val", "test"])
@@ -404,7 +549,13 @@ def build_index_from_coco(
         if split not in include_splits:
             continue
         try:
-            payload = json.loads(ann_file.read_text(encoding="utf-8"))
+            if orjson is not None:
+                # COCO exports run to hundreds of MB; orjson parses the raw
+                # bytes without a separate text-decode pass. Its decode
+                # error subclasses json.JSONDecodeError.
+                payload = orjson.loads(ann_file.read_bytes())
+            else:
+                payload = json.loads(ann_file.read_text(encoding="utf-8"))
         except json.JSONDecodeError as exc:
             raise DatasetSpecError(f"Invalid COCO JSON: {ann_file}") from exc
         if not isinstance(payload, dict):
@@ -423,15 +574,22 @@ def build_index_from_coco(
 
     sorted_cat_ids = sorted(category_names_by_id)
     class_index_by_cat_id = {cid: idx for idx, cid in enumerate(sorted_cat_ids)}
+    class_index_get = class_index_by_cat_id.get
     class_names = [category_names_by_id[cid] for cid in sorted_cat_ids]
 
     images_rows: list[dict[str, Any]] = []
     split_stats: dict[str, dict[str, Any]] = {}
     total_seen = 0
 
-    for split, ann_file, payload in sorted(parsed_payloads, key=lambda x: (x[0], str(x[1]))):
+    # Consume files in (split, path) order while releasing each parsed
+    # payload as soon as its rows are emitted; keeping every split's
+    # multi-hundred-MB JSON tree alive until the end dominated peak RSS.
+    parsed_payloads.sort(key=lambda x: (x[0], str(x[1])), reverse=True)
+    while parsed_payloads:
+        split, ann_file, payload = parsed_payloads.pop()
         image_items = payload.get("images", [])
         ann_items = payload.get("annotations", [])
+        del payload
         try:
             annotation_stat = ann_file.stat()
             annotation_size_bytes = int(annotation_stat.st_size)
@@ -439,13 +597,18 @@ def build_index_from_coco(
         except OSError:
             annotation_size_bytes = -1
             annotation_mtime_ns = -1
+        # image_id is an int in well-formed exports, so the common case is
+        # one dict hit and one append with no int() call or except setup.
         anns_by_image: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        bucket_for = anns_by_image.__getitem__
         for ann in ann_items:
-            try:
-                image_id = int(ann.get("image_id"))
-            except Exception:
-                continue
-            anns_by_image[image_id].append(ann)
+            image_id = ann.get("image_id")
+            if type(image_id) is not int:
+                try:
+                    image_id = int(image_id)
+                except Exception:
+                    continue
+            bucket_for(image_id).append(ann)
 
         for image_obj in image_items:
             if max_images > 0 and total_seen >= max_images:
@@ -482,13 +645,16 @@ def build_index_from_coco(
                         cached
                         and cached.get("size_bytes") == size_bytes
                         and cached.get("mtime_ns") == mtime_ns
+                        and (not need_content_hash or cached.get("sha256"))
                     ):
                         cache_hits += 1
                         sha256 = str(cached.get("sha256", ""))
                         image_error = cached.get("image_error")
                     else:
                         cache_misses += 1
-                        if hash_executor is None:
+                        if not need_content_hash:
+                            sha256 = ""
+                        elif hash_executor is None:
                             sha256 = _sha256_file(image_path)
                         else:
                             sha256 = ""
@@ -509,17 +675,22 @@ def build_index_from_coco(
 
             label_rows: list[dict[str, Any]] = []
             parse_errors: list[dict[str, Any]] = []
+            # Bound-method locals skip the attribute lookup CPython
+            # would otherwise repeat for every annotation.
+            append_row = label_rows.append
+            append_error = parse_errors.append
 
             for ann in anns_by_image.get(image_id, []):
-                line = int(ann.get("id", 0) or 0)
+                ann_get = ann.get
+                line = int(ann_get("id", 0) or 0)
                 try:
-                    category_id = int(ann.get("category_id"))
+                    category_id = int(ann_get("category_id"))
                 except Exception:
-                    parse_errors.append({"line": line, "raw": "", "reason": "missing_category_id"})
+                    append_error({"line": line, "raw": "", "reason": "missing_category_id"})
                     continue
-                class_id = class_index_by_cat_id.get(category_id, -1)
+                class_id = class_index_get(category_id, -1)
 
-                segmentation = ann.get("segmentation")
+                segmentation = ann_get("segmentation")
                 used = False
                 if isinstance(segmentation, list) and segmentation:
                     seg0 = segmentation[0]
@@ -527,14 +698,14 @@ def build_index_from_coco(
                         try:
                             coords_abs = [float(v) for v in seg0]
                         except Exception:
-                            parse_errors.append({"line": line, "raw": "", "reason": "non_numeric_segmentation"})
+                            append_error({"line": line, "raw": "", "reason": "non_numeric_segmentation"})
                             continue
                         coords = _normalize_segment(coords_abs, img_w, img_h)
                         xs = coords[0::2]
                         ys = coords[1::2]
                         x_min, x_max = min(xs), max(xs)
                         y_min, y_max = min(ys), max(ys)
-                        label_rows.append(
+                        append_row(
                             {
                                 "line": line,
                                 "annotation_type": "segment",
@@ -552,12 +723,12 @@ def build_index_from_coco(
                 if used:
                     continue
 
-                bbox = ann.get("bbox")
+                bbox = ann_get("bbox")
                 if isinstance(bbox, list) and len(bbox) == 4:
                     try:
                         x, y, w, h = [float(v) for v in bbox]
                     except Exception:
-                        parse_errors.append({"line": line, "raw": "", "reason": "non_numeric_bbox"})
+                        append_error({"line": line, "raw": "", "reason": "non_numeric_bbox"})
                         continue
                     if img_w > 0 and img_h > 0:
                         x_center = (x + (w / 2.0)) / img_w
@@ -566,7 +737,7 @@ def build_index_from_coco(
                         height = h / img_h
                     else:
                         x_center = y_center = width = height = 0.0
-                    label_rows.append(
+                    append_row(
                         {
                             "line": line,
                             "annotation_type": "bbox",
@@ -579,7 +750,7 @@ def build_index_from_coco(
                         }
                     )
                 else:
-                    parse_errors.append({"line": line, "raw": "", "reason": "missing_bbox_or_segmentation"})
+                    append_error({"line": line, "raw": "", "reason": "missing_bbox_or_segmentation"})
 
             images_rows.append(
                 {
@@ -620,10 +791,7 @@ def build_index_from_coco(
     if hash_executor is not None:
         hash_executor.shutdown()
 
-    cache_basis = []
-    for row in images_rows:
-        cache_basis.append(f"{row['image']}|{row['size_bytes']}|{row['mtime_ns']}|{row['sha256']}")
-    digest = hashlib.sha256("\n".join(cache_basis).encode("utf-8")).hexdigest()
+    digest = _cache_digest(images_rows)
 
     payload = {
         "schema_version": "1.0.0",
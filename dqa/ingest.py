@@ -13,7 +13,7 @@ class ArchiveValidationError(ValueError):
     """Raised when an uploaded archive violates hosted ingestion policy."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArchivePolicy:
     max_archive_bytes: int = 2 * 1024**3
     max_expanded_bytes: int = 10 * 1024**3
@@ -21,7 +21,7 @@ class ArchivePolicy:
     max_compression_ratio: float = 20.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidatedArchive:
     entries: int
     files: int
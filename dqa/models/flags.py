@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 from .common import Severity
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finding:
     id: str
     severity: Severity
@@ -18,3 +19,11 @@ class Finding:
     class_id: int | None = None
     metrics: dict[str, Any] | None = None
     suggested_action: str | None = None
+
+    def __post_init__(self) -> None:
+        # Severity and split draw from a tiny fixed alphabet, so intern
+        # them once here and every downstream bin lookup or comparison
+        # becomes a pointer check instead of a character walk.
+        object.__setattr__(self, "severity", sys.intern(self.severity))
+        if self.split is not None:
+            object.__setattr__(self, "split", sys.intern(self.split))
@@ -2,14 +2,21 @@ from __future__ import annotations
 
 import json
 import os
+import random
 import re
 import shutil
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 from dqa.ingest import ArchiveValidationError, extract_validated_zip
 
 
@@ -19,6 +26,7 @@ class RoboflowProviderError(ValueError):
 
 _MAX_RETRIES = 3
 _BACKOFF_SECONDS = 0.8
+_TOKEN_RE = re.compile(r"[A-Za-z0-9._-]+")
 
 
 def _require_https_url(url: str, *, roboflow_host: bool = False) -> str:
@@ -48,11 +56,11 @@ def _parse_reference(url: str) -> tuple[str, str, str]:
     else:
         version = parts[2]
 
-    if not re.match(r"^[A-Za-z0-9._-]+$", workspace):
+    if not _TOKEN_RE.fullmatch(workspace):
         raise RoboflowProviderError("Could not parse workspace from Roboflow URL.")
-    if not re.match(r"^[A-Za-z0-9._-]+$", project):
+    if not _TOKEN_RE.fullmatch(project):
         raise RoboflowProviderError("Could not parse project from Roboflow URL.")
-    if not re.match(r"^[A-Za-z0-9._-]+$", version):
+    if not _TOKEN_RE.fullmatch(version):
         raise RoboflowProviderError("Could not parse version from Roboflow URL.")
     return workspace, project, version
 
@@ -62,13 +70,18 @@ def _http_json(url: str, timeout_sec: float = 30.0) -> dict:
     req = urllib.request.Request(url, headers={"User-Agent": "DQA/0.1.0"})
     try:
         with urllib.request.urlopen(req, timeout=timeout_sec) as resp:  # nosec B310
-            data = resp.read().decode("utf-8", errors="replace")
+            data = resp.read()
     except urllib.error.HTTPError as exc:
         raise RoboflowProviderError(f"Roboflow API HTTP {exc.code}: {exc.reason}") from exc
     except urllib.error.URLError as exc:
         raise RoboflowProviderError(f"Roboflow API connection failed: {exc.reason}") from exc
     try:
-        payload = json.loads(data)
+        if orjson is not None:
+            # orjson parses the raw bytes directly; its decode error
+            # subclasses json.JSONDecodeError.
+            payload = orjson.loads(data)
+        else:
+            payload = json.loads(data.decode("utf-8", errors="replace"))
     except json.JSONDecodeError as exc:
         raise RoboflowProviderError("Roboflow API returned non-JSON response.") from exc
     if not isinstance(payload, dict):
@@ -76,49 +89,66 @@ def _http_json(url: str, timeout_sec: float = 30.0) -> dict:
     return payload
 
 
-def _http_json_with_retry(url: str, timeout_sec: float = 30.0, retries: int = _MAX_RETRIES) -> dict:
+def _backoff_or_give_up(attempt: int, deadline: float) -> bool:
+    """Sleep before the next retry, or report False when the monotonic
+    deadline would pass before the attempt could start. Jitter spreads
+    concurrent clients instead of synchronizing them on the API."""
+    backoff = random.uniform(0.5, 1.5) * _BACKOFF_SECONDS * 2 ** (attempt - 1)
+    if time.monotonic() + backoff > deadline:
+        return False
+    time.sleep(backoff)
+    return True
+
+
+def _http_json_with_retry(
+    url: str,
+    timeout_sec: float = 30.0,
+    retries: int = _MAX_RETRIES,
+    deadline_sec: float = 90.0,
+) -> dict:
+    deadline = time.monotonic() + deadline_sec
     last_error: RoboflowProviderError | None = None
     for attempt in range(1, retries + 1):
         try:
             return _http_json(url, timeout_sec=timeout_sec)
         except RoboflowProviderError as exc:
             last_error = exc
-            if attempt < retries:
-                time.sleep(_BACKOFF_SECONDS * attempt)
+            if attempt < retries and not _backoff_or_give_up(attempt, deadline):
+                break
     if last_error:
         raise last_error
     raise RoboflowProviderError("Unknown error while fetching Roboflow API JSON.")
 
 
 def _find_first_url(value: object) -> str | None:
-    if isinstance(value, str):
-        low = value.lower()
-        if low.startswith("http://") or low.startswith("https://"):
-            return value
-        return None
-    if isinstance(value, dict):
-        for candidate_key in ("download", "url", "export", "export_url", "download_url"):
-            if candidate_key in value:
-                found = _find_first_url(value[candidate_key])
-                if found:
-                    return found
-        for child in value.values():
-            found = _find_first_url(child)
-            if found:
-                return found
-        return None
-    if isinstance(value, list):
-        for child in value:
-            found = _find_first_url(child)
-            if found:
-                return found
+    # Iterative depth-first walk: children are pushed in reverse so they
+    # pop in the same order the old recursive version visited them, with
+    # no call-frame cost or recursion-depth limit on deep payloads.
+    stack: list[object] = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            low = node.lower()
+            if low.startswith("http://") or low.startswith("https://"):
+                return node
+        elif isinstance(node, dict):
+            children = [
+                node[candidate_key]
+                for candidate_key in ("download", "url", "export", "export_url", "download_url")
+                if candidate_key in node
+            ]
+            children.extend(node.values())
+            stack.extend(reversed(children))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
     return None
 
 
-def _format_aliases(format_name: str) -> list[str]:
+@lru_cache(maxsize=16)
+def _format_aliases(format_name: str) -> tuple[str, ...]:
     normalized = (format_name or "").strip().lower()
     if not normalized:
-        return ["yolov11"]
+        return ("yolov11",)
 
     aliases: list[str] = [normalized]
 
@@ -144,7 +174,7 @@ def _format_aliases(format_name: str) -> list[str]:
         if item not in seen:
             seen.add(item)
             dedup.append(item)
-    return dedup
+    return tuple(dedup)
 
 
 def _payload_keys(payload: dict[str, object]) -> str:
@@ -156,7 +186,7 @@ def _resolve_export_url(workspace: str, project: str, version: str, format_name:
     params = urllib.parse.urlencode({"api_key": api_key})
 
     tried_formats = _format_aliases(format_name)
-    inspected_payload_keys: list[str] = []
+    inspected_payloads: list[tuple[str, dict]] = []
     endpoint_failures: list[str] = []
 
     last_error: RoboflowProviderError | None = None
@@ -175,64 +205,164 @@ def _resolve_export_url(workspace: str, project: str, version: str, format_name:
                 endpoint_failures.append(f"{fmt}:{endpoint} -> {exc}")
                 continue
 
-            inspected_payload_keys.append(f"{fmt}:[{_payload_keys(payload)}]")
             found = _find_first_url(payload)
             if found:
                 return found
+            inspected_payloads.append((fmt, payload))
 
-    if inspected_payload_keys:
+    if inspected_payloads:
+        # Key summaries are only rendered here, on the failure path, so
+        # successful resolutions never pay the sort/join per response.
+        observed = "; ".join(
+            f"{fmt}:[{_payload_keys(payload)}]" for fmt, payload in inspected_payloads[:6]
+        )
         raise RoboflowProviderError(
             "Could not resolve export download URL from Roboflow response. "
-            f"Tried formats={tried_formats}. "
-            f"Observed payload keys={'; '.join(inspected_payload_keys[:6])}."
+            f"Tried formats={list(tried_formats)}. "
+            f"Observed payload keys={observed}."
         )
 
     if last_error:
         raise RoboflowProviderError(
-            f"Could not resolve export URL after trying formats={tried_formats}. "
+            f"Could not resolve export URL after trying formats={list(tried_formats)}. "
             f"Last error: {last_error}"
         ) from last_error
 
     raise RoboflowProviderError(
-        f"Could not resolve export URL. Tried formats={tried_formats}."
+        f"Could not resolve export URL. Tried formats={list(tried_formats)}."
     )
 
 
-def _download_file(url: str, dest: Path, timeout_sec: float = 120.0) -> None:
+def _download_file(url: str, dest: Path, timeout_sec: float = 120.0) -> dict[str, str]:
     _require_https_url(url)
     req = urllib.request.Request(url, headers={"User-Agent": "DQA/0.1.0"})
     try:
         with urllib.request.urlopen(req, timeout=timeout_sec) as resp:  # nosec B310
+            headers = {
+                "etag": resp.headers.get("ETag", ""),
+                "last_modified": resp.headers.get("Last-Modified", ""),
+                "content_length": resp.headers.get("Content-Length", ""),
+            }
             dest.parent.mkdir(parents=True, exist_ok=True)
             with dest.open("wb") as out:
-                shutil.copyfileobj(resp, out)
+                # readinto a reused 1 MiB buffer: each chunk lands in
+                # the same preallocated memory instead of a fresh bytes
+                # object per read the copyfileobj loop would allocate.
+                if hasattr(resp, "readinto"):
+                    view = memoryview(bytearray(1 << 20))
+                    while n := resp.readinto(view):
+                        out.write(view[:n])
+                else:
+                    shutil.copyfileobj(resp, out, length=1 << 20)
+            return headers
     except urllib.error.HTTPError as exc:
         raise RoboflowProviderError(f"Dataset download HTTP {exc.code}: {exc.reason}") from exc
     except urllib.error.URLError as exc:
         raise RoboflowProviderError(f"Dataset download failed: {exc.reason}") from exc
 
 
-def _download_file_with_retry(url: str, dest: Path, timeout_sec: float = 120.0, retries: int = _MAX_RETRIES) -> None:
+def _download_file_with_retry(
+    url: str,
+    dest: Path,
+    timeout_sec: float = 120.0,
+    retries: int = _MAX_RETRIES,
+    deadline_sec: float = 600.0,
+) -> dict[str, str]:
+    deadline = time.monotonic() + deadline_sec
     last_error: RoboflowProviderError | None = None
     for attempt in range(1, retries + 1):
         try:
-            _download_file(url, dest, timeout_sec=timeout_sec)
-            return
+            return _download_file(url, dest, timeout_sec=timeout_sec)
         except RoboflowProviderError as exc:
             last_error = exc
-            if attempt < retries:
-                time.sleep(_BACKOFF_SECONDS * attempt)
+            if attempt < retries and not _backoff_or_give_up(attempt, deadline):
+                break
     if last_error:
         raise last_error
     raise RoboflowProviderError("Unknown error while downloading dataset archive.")
 
 
+def _load_manifest(run_dir: Path) -> dict[str, str] | None:
+    try:
+        payload = json.loads((run_dir / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _write_manifest(run_dir: Path, headers: dict[str, str]) -> None:
+    try:
+        (run_dir / "manifest.json").write_text(
+            json.dumps(headers, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+    except OSError:
+        pass
+
+
+def _archive_unchanged(url: str, manifest: dict[str, str], timeout_sec: float = 30.0) -> bool:
+    """Revalidate a cached archive with a conditional GET.
+
+    A 304 means the server still serves the bytes we extracted, so a
+    TTL-expired cache can be reused without re-downloading hundreds of
+    MB. Any error or a changed validator reports False and the caller
+    downloads as usual.
+    """
+    etag = str(manifest.get("etag", ""))
+    if not etag:
+        return False
+    req = urllib.request.Request(
+        url, headers={"User-Agent": "DQA/0.1.0", "If-None-Match": etag}
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=timeout_sec) as resp:  # nosec B310
+            return resp.status == 304
+    except urllib.error.HTTPError as exc:
+        return exc.code == 304
+    except urllib.error.URLError:
+        return False
+
+
+# data.yaml sits in the first directory level or two of an export;
+# image/label subtrees can hold tens of thousands of files and never
+# contain it, so the search prunes them and stops after a few levels.
+_SCAN_SKIP_DIRS = frozenset({"images", "labels", "train", "val", "valid", "test", "annotations"})
+_SCAN_MAX_DEPTH = 4
+
+
 def _find_data_yaml(root: Path) -> Path:
-    candidates = sorted(p for p in root.rglob("data.yaml") if p.is_file())
-    if not candidates:
-        raise RoboflowProviderError("Downloaded archive does not contain data.yaml.")
-    candidates.sort(key=lambda p: (len(p.parts), str(p)))
-    return candidates[0]
+    level = [root]
+    for _depth in range(_SCAN_MAX_DEPTH + 1):
+        matches: list[str] = []
+        next_level: list[str] = []
+        for directory in level:
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.name == "data.yaml" and entry.is_file():
+                            matches.append(entry.path)
+                        elif entry.is_dir(follow_symlinks=False) and entry.name.lower() not in _SCAN_SKIP_DIRS:
+                            next_level.append(entry.path)
+                    except OSError:
+                        continue
+        if matches:
+            # Level-order search already guarantees the shallowest match;
+            # sorting keeps ties deterministic like the old full scan.
+            return Path(min(matches))
+        if not next_level:
+            break
+        level = next_level
+    raise RoboflowProviderError("Downloaded archive does not contain data.yaml.")
+
+
+def _record_data_yaml(marker: Path, extract_dir: Path, data_yaml: Path) -> None:
+    try:
+        marker.write_text(data_yaml.relative_to(extract_dir).as_posix() + "\n", encoding="utf-8")
+    except (OSError, ValueError):
+        pass
 
 
 def _is_cache_fresh(data_yaml: Path, ttl_hours: float | None) -> bool:
@@ -266,20 +396,52 @@ def resolve_roboflow_data_yaml(
     zip_path = run_dir / "dataset.zip"
     extract_dir = run_dir / "extracted"
 
+    marker = run_dir / "data_yaml_path.txt"
     if use_cache and extract_dir.exists():
+        # Warm reruns first reuse the recorded data.yaml location; that
+        # skips re-walking the whole extracted tree with rglob.
+        if marker.is_file():
+            try:
+                recorded = extract_dir / marker.read_text(encoding="utf-8").strip()
+            except OSError:
+                recorded = None
+            if recorded is not None and recorded.is_file() and _is_cache_fresh(recorded, cache_ttl_hours):
+                return recorded
         try:
             cached_yaml = _find_data_yaml(extract_dir)
             if _is_cache_fresh(cached_yaml, cache_ttl_hours):
+                _record_data_yaml(marker, extract_dir, cached_yaml)
                 return cached_yaml
         except RoboflowProviderError:
             pass
 
     download_url = _resolve_export_url(workspace, project, version, format_name, api_key)
-    _download_file_with_retry(download_url, zip_path)
+
+    if use_cache and extract_dir.exists():
+        # TTL-expired but still extracted: one conditional request can
+        # confirm the export is byte-identical and skip the download.
+        manifest = _load_manifest(run_dir)
+        if manifest is not None and _archive_unchanged(download_url, manifest):
+            try:
+                cached_yaml = _find_data_yaml(extract_dir)
+            except RoboflowProviderError:
+                cached_yaml = None
+            if cached_yaml is not None:
+                try:
+                    os.utime(cached_yaml)
+                except OSError:
+                    pass
+                _record_data_yaml(marker, extract_dir, cached_yaml)
+                return cached_yaml
+
+    headers = _download_file_with_retry(download_url, zip_path)
+    _write_manifest(run_dir, headers)
     shutil.rmtree(extract_dir, ignore_errors=True)
     try:
         extract_validated_zip(zip_path, extract_dir)
     except ArchiveValidationError as exc:
         raise RoboflowProviderError(f"Downloaded archive rejected: {exc}") from exc
 
-    return _find_data_yaml(extract_dir)
+    data_yaml = _find_data_yaml(extract_dir)
+    _record_data_yaml(marker, extract_dir, data_yaml)
+    return data_yaml
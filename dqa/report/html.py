@@ -1,42 +1,25 @@
 from __future__ import annotations
 
 import html
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+@lru_cache(maxsize=4096)
+def _escape_str(value: str) -> str:
+    return html.escape(value)
+
+
 def _escape(value: object) -> str:
-    return html.escape(str(value))
+    # Severities, splits, check names and finding ids repeat thousands
+    # of times per report, so most escapes are cache hits.
+    return _escape_str(value if isinstance(value, str) else str(value))
 
 
-def render_html(summary: dict[str, Any], flags: dict[str, Any]) -> str:
-    checks_rows = []
-    for name, check in summary.get("checks", {}).items():
-        counts = check.get("counts", {})
-        checks_rows.append(
-            "<tr>"
-            f"<td>{_escape(name)}</td>"
-            f"<td>{_escape(check.get('status', 'unknown'))}</td>"
-            f"<td>{_escape(counts.get('critical', 0))}</td>"
-            f"<td>{_escape(counts.get('high', 0))}</td>"
-            f"<td>{_escape(counts.get('medium', 0))}</td>"
-            f"<td>{_escape(counts.get('low', 0))}</td>"
-            "</tr>"
-        )
-
-    finding_rows = []
-    for finding in flags.get("findings", []):
-        finding_rows.append(
-            "<tr>"
-            f"<td>{_escape(finding.get('id', ''))}</td>"
-            f"<td>{_escape(finding.get('severity', ''))}</td>"
-            f"<td>{_escape(finding.get('split', ''))}</td>"
-            f"<td>{_escape(finding.get('image', finding.get('label', '')))}</td>"
-            f"<td>{_escape(finding.get('message', ''))}</td>"
-            "</tr>"
-        )
-
-    return f"""<!doctype html>
+# Built once at import: the page skeleton never changes between runs, so
+# render_html only pays for the row strings and one format_map call.
+_HTML_TEMPLATE = """<!doctype html>
 <html lang=\"en\">
 <head>
   <meta charset=\"utf-8\" />
@@ -55,11 +38,11 @@ def render_html(summary: dict[str, Any], flags: dict[str, Any]) -> str:
 <body>
   <h1>Dataset Quality Analyzer Report</h1>
   <div class=\"meta\">
-    <div><strong>Run ID:</strong> {_escape(summary.get('run', {}).get('run_id', ''))}</div>
-    <div><strong>Data YAML:</strong> {_escape(summary.get('dataset', {}).get('data_yaml', ''))}</div>
-    <div><strong>Root:</strong> {_escape(summary.get('dataset', {}).get('root', ''))}</div>
-    <div><strong>Total Findings:</strong> <span class=\"badge\">{_escape(summary.get('totals', {}).get('findings', 0))}</span></div>
-    <div><strong>Build Failed:</strong> <span class=\"badge\">{_escape(summary.get('totals', {}).get('build_failed', False))}</span></div>
+    <div><strong>Run ID:</strong> {run_id}</div>
+    <div><strong>Data YAML:</strong> {data_yaml}</div>
+    <div><strong>Root:</strong> {root}</div>
+    <div><strong>Total Findings:</strong> <span class=\"badge\">{total_findings}</span></div>
+    <div><strong>Build Failed:</strong> <span class=\"badge\">{build_failed}</span></div>
   </div>
 
   <h2>Check Summary</h2>
@@ -68,7 +51,7 @@ def render_html(summary: dict[str, Any], flags: dict[str, Any]) -> str:
       <tr><th>Check</th><th>Status</th><th>Critical</th><th>High</th><th>Medium</th><th>Low</th></tr>
     </thead>
     <tbody>
-      {''.join(checks_rows)}
+      {checks_rows}
     </tbody>
   </table>
 
@@ -78,7 +61,7 @@ def render_html(summary: dict[str, Any], flags: dict[str, Any]) -> str:
       <tr><th>ID</th><th>Severity</th><th>Split</th><th>Path</th><th>Message</th></tr>
     </thead>
     <tbody>
-      {''.join(finding_rows) if finding_rows else '<tr><td colspan="5">No findings</td></tr>'}
+      {finding_rows}
     </tbody>
   </table>
 </body>
@@ -86,6 +69,54 @@ def render_html(summary: dict[str, Any], flags: dict[str, Any]) -> str:
 """
 
 
+def _check_row(name: str, check: dict[str, Any]) -> str:
+    counts = check.get("counts", {})
+    return (
+        "<tr>"
+        f"<td>{_escape(name)}</td>"
+        f"<td>{_escape(check.get('status', 'unknown'))}</td>"
+        f"<td>{_escape(counts.get('critical', 0))}</td>"
+        f"<td>{_escape(counts.get('high', 0))}</td>"
+        f"<td>{_escape(counts.get('medium', 0))}</td>"
+        f"<td>{_escape(counts.get('low', 0))}</td>"
+        "</tr>"
+    )
+
+
+def _finding_row(finding: dict[str, Any]) -> str:
+    return (
+        "<tr>"
+        f"<td>{_escape(finding.get('id', ''))}</td>"
+        f"<td>{_escape(finding.get('severity', ''))}</td>"
+        f"<td>{_escape(finding.get('split', ''))}</td>"
+        f"<td>{_escape(finding.get('image', finding.get('label', '')))}</td>"
+        f"<td>{_escape(finding.get('message', ''))}</td>"
+        "</tr>"
+    )
+
+
+def render_html(summary: dict[str, Any], flags: dict[str, Any]) -> str:
+    checks_rows = "".join(
+        _check_row(name, check) for name, check in summary.get("checks", {}).items()
+    )
+    finding_rows = "".join(_finding_row(finding) for finding in flags.get("findings", []))
+
+    run = summary.get("run", {})
+    dataset = summary.get("dataset", {})
+    totals = summary.get("totals", {})
+    return _HTML_TEMPLATE.format_map(
+        {
+            "run_id": _escape(run.get("run_id", "")),
+            "data_yaml": _escape(dataset.get("data_yaml", "")),
+            "root": _escape(dataset.get("root", "")),
+            "total_findings": _escape(totals.get("findings", 0)),
+            "build_failed": _escape(totals.get("build_failed", False)),
+            "checks_rows": checks_rows,
+            "finding_rows": finding_rows or '<tr><td colspan="5">No findings</td></tr>',
+        }
+    )
+
+
 def write_html(path: Path, summary: dict[str, Any], flags: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(render_html(summary, flags), encoding="utf-8")
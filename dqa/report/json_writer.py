@@ -6,15 +6,36 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
+# Matches json.dumps(indent=2, sort_keys=True) layout; orjson emits raw
+# UTF-8 where stdlib would escape non-ASCII, both parse identically.
+_ORJSON_OPTS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+    if orjson is not None
+    else 0
+)
+
+
+def _encode(payload: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=_ORJSON_OPTS)
+        except TypeError:  # pragma: no cover - payloads are plain JSON types
+            pass
+    return (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
 
 def write_json(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    content = json.dumps(payload, indent=2, sort_keys=True) + "\n"
+    content = _encode(payload)
     temp_path: Path | None = None
     try:
         with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
+            mode="wb",
             dir=path.parent,
             prefix=f".{path.name}.",
             suffix=".tmp",
@@ -13,7 +13,7 @@ from .lifecycle import JobLifecycle
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthContext:
     owner_id: str
     scopes: frozenset[str]
@@ -23,7 +23,7 @@ class RateLimiter(Protocol):
     def allow(self, owner_id: str, action: str) -> bool: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ApiResponse:
     status_code: int
     body: dict[str, object]
@@ -9,7 +9,7 @@ from .jobs import JobRecord
 DOWNLOAD_TTL_SECONDS = 300
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StoredArtifact:
     key: str
     size: int
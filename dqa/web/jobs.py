@@ -24,7 +24,7 @@ class IdempotencyConflictError(RuntimeError):
     """Raised when an idempotency key is reused for a different request."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobRequest:
     dataset_key: str
     preset: Preset = "detection"
@@ -32,7 +32,7 @@ class JobRequest:
     near_duplicates: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobRecord:
     job_id: str
     owner_id: str
@@ -74,7 +74,7 @@ class JobRecord:
         return {key: value for key, value in payload.items() if value is not None}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SecurityEvent:
     action: str
     outcome: Literal["allowed", "denied", "failed"]
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta, timezone
 from .jobs import JobRecord
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetentionPolicy:
     source_hours_after_completion: int = 24
     successful_artifact_days: int = 7
@@ -14,7 +14,7 @@ class RetentionPolicy:
     job_metadata_days: int = 30
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetentionDeadlines:
     source_expires_at: str
     artifacts_expire_at: str
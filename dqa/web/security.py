@@ -9,7 +9,7 @@ class RateLimitCounter(Protocol):
     def consume(self, key: str, *, window_start: int, limit: int) -> bool: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RateLimitPolicy:
     requests: int
     window_seconds: int
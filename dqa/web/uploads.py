@@ -15,20 +15,20 @@ class UploadInputError(ValueError):
     """Raised when an upload declaration is unsafe or outside hosted limits."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UploadRequest:
     filename: str
     size_bytes: int
     checksum_sha256: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PresignedPost:
     url: str
     fields: dict[str, str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UploadIntent:
     upload_id: str
     object_key: str
@@ -0,0 +1,21 @@
+"""JSON helpers for test fixtures: orjson when installed, stdlib otherwise.
+
+Mirrors the package's fast-json optional dependency so fixture payloads
+serialize through the same fast path the code under test prefers.
+"""
+from __future__ import annotations
+
+try:
+    import orjson
+
+    def dumps(payload: object) -> bytes:
+        return orjson.dumps(payload)
+
+    loads = orjson.loads
+except ModuleNotFoundError:  # pragma: no cover
+    import json
+
+    def dumps(payload: object) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+    loads = json.loads
@@ -3,6 +3,17 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _warm_cli() -> None:
+    # Build the argparse tree once up front so no individual test pays
+    # for the first-touch construction.
+    from dqa.cli import build_parser
+
+    build_parser()
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import contextlib
+import io
+import json
 from dataclasses import replace
 
 from dqa.aws.adapters import (
     BatchJobQueue,
     DynamoAdmissionGate,
     DynamoJobStore,
+    JsonSecurityEventSink,
     S3UploadPostSigner,
     _job_from_item,
     _job_item,
 )
 from dqa.aws.api_handler import handler
-from dqa.web.jobs import JobRecord
+from dqa.web.jobs import JobRecord, SecurityEvent
 
 
 def _job(**changes: object) -> JobRecord:
@@ -152,3 +156,24 @@ def test_s3_post_signer_binds_key_length_checksum_and_encryption() -> None:
 def test_lambda_health_does_not_initialize_aws_clients() -> None:
     response = handler({"rawPath": "/health"}, None)
     assert response["statusCode"] == 200
+
+
+def test_json_security_event_sink_serializes_slotted_event() -> None:
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        JsonSecurityEventSink().emit(
+            SecurityEvent(
+                action="job.submit",
+                outcome="denied",
+                occurred_at="2026-07-15T00:00:00Z",
+                owner_id="owner-1",
+                reason="quota",
+            )
+        )
+
+    payload = json.loads(buf.getvalue())
+    assert payload["event"] == "security"
+    assert payload["action"] == "job.submit"
+    assert payload["outcome"] == "denied"
+    assert payload["owner_id"] == "owner-1"
+    assert payload["reason"] == "quota"
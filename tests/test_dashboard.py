@@ -1,8 +1,21 @@
 from __future__ import annotations
 
+import json
+import threading
+import urllib.request
+
 import pytest
 
-from web_dashboard import DashboardError, _build_audit, _build_diff, _build_explain, _build_validate
+from web_dashboard import (
+    DashboardError,
+    DashboardHandler,
+    PooledHTTPServer,
+    _build_audit,
+    _build_diff,
+    _build_explain,
+    _build_validate,
+    _parse_form,
+)
 
 
 def test_dashboard_audit_keeps_user_values_as_single_arguments() -> None:
@@ -37,3 +50,43 @@ def test_dashboard_secondary_command_builders() -> None:
     assert explain[-2:] == ["--format", "text"]
     assert validate[-4:] == ["--artifact", "a.json", "--schema", "a.schema.json"]
     assert diff[-4:] == ["--old", "runs/a", "--new", "runs/b"]
+
+
+def test_dashboard_parse_form_keeps_first_value_and_drops_blanks() -> None:
+    form = _parse_form("a=1&a=2&b=x+y%26z&cleared=&flagless")
+
+    assert form == {"a": ["1"], "b": ["x y&z"]}
+    # A cleared text input must not shadow the builder defaults.
+    cmd, _ = _build_audit(_parse_form("audit_data=d.yaml&audit_out="))
+    assert cmd[cmd.index("--out") + 1] == "runs/web_audit"
+
+
+def test_dashboard_batch_endpoint_runs_all_jobs(tmp_path) -> None:
+    server = PooledHTTPServer(("127.0.0.1", 0), DashboardHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        artifact = tmp_path / "summary.json"
+        artifact.write_text("{}", encoding="utf-8")
+        jobs = [
+            {
+                "path": "/run/validate",
+                "form": {
+                    "validate_artifact": str(artifact),
+                    "validate_schema": "schemas/summary.schema.json",
+                },
+            },
+            {"path": "/run/unknown", "form": {}},
+        ]
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{server.server_address[1]}/run/batch",
+            data=json.dumps(jobs).encode("utf-8"),
+        )
+        body = urllib.request.urlopen(request).read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "Job 1" in body
+    assert "Job 2: Failed" in body
+    assert "Unknown job path" in body
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import json
+import contextlib
+import io
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -9,28 +10,47 @@ import pytest
 from dqa.cli import ExplainError, run_explain
 
 
-def test_explain_low_only_summary(capsys: pytest.CaptureFixture[str], tmp_path: Path) -> None:
-    run_dir = tmp_path / "run"
-    run_dir.mkdir(parents=True, exist_ok=True)
-
-    summary = {
-        "totals": {
-            "build_failed": False,
-            "by_severity": {"critical": 0, "high": 0, "medium": 0, "low": 3},
-        }
-    }
-    flags = {
-        "findings": [
-            {"id": "CLASS_LOW_SUPPORT", "severity": "low", "message": "x"},
-            {"id": "CLASS_LOW_SUPPORT", "severity": "low", "message": "x"},
-            {"id": "CLASS_LOW_SUPPORT", "severity": "low", "message": "x"},
-        ]
-    }
-    (run_dir / "summary.json").write_text(json.dumps(summary), encoding="utf-8")
-    (run_dir / "flags.json").write_text(json.dumps(flags), encoding="utf-8")
-
-    rc = run_explain(SimpleNamespace(run=run_dir, summary=None, flags=None))
-    out = capsys.readouterr().out
+# Serialized once as byte templates: only the low count varies between
+# fixtures, so a %-substitution replaces a dict build plus a full JSON
+# serialization per payload.
+_SUMMARY_TMPL = (
+    b'{"totals":{"build_failed":false,'
+    b'"by_severity":{"critical":0,"high":0,"medium":0,"low":%d}}}'
+)
+_FINDING_BYTES = b'{"id":"CLASS_LOW_SUPPORT","severity":"low","message":"x"}'
+
+
+def _payload_bytes(low: int) -> tuple[bytes, bytes]:
+    flags = b'{"findings":[' + b",".join([_FINDING_BYTES] * low) + b"]}"
+    return _SUMMARY_TMPL % low, flags
+
+
+def _write_run(directory: Path, low: int) -> Path:
+    summary_bytes, flags_bytes = _payload_bytes(low)
+    (directory / "summary.json").write_bytes(summary_bytes)
+    (directory / "flags.json").write_bytes(flags_bytes)
+    return directory
+
+
+@pytest.fixture(scope="module")
+def low_only_run(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Shared read-only artifacts: run_explain never writes into the run
+    # directory, so one copy serves every test in the module.
+    return _write_run(tmp_path_factory.mktemp("run_low3"), low=3)
+
+
+@pytest.fixture(scope="module")
+def single_low_run(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return _write_run(tmp_path_factory.mktemp("run_low1"), low=1)
+
+
+def test_explain_low_only_summary(low_only_run: Path) -> None:
+    # redirect_stdout captures at the Python level without pytest's
+    # capture-manager install/uninstall around the test body.
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        rc = run_explain(SimpleNamespace(run=low_only_run, summary=None, flags=None))
+    out = buf.getvalue()
 
     assert rc == 0
     assert "DQA Explain" in out
@@ -43,46 +63,28 @@ def test_explain_requires_inputs(tmp_path: Path) -> None:
         run_explain(SimpleNamespace(run=None, summary=None, flags=None))
 
 
-def test_explain_markdown_output(capsys: pytest.CaptureFixture[str], tmp_path: Path) -> None:
-    run_dir = tmp_path / "run_md"
-    run_dir.mkdir(parents=True, exist_ok=True)
-
-    summary = {
-        "totals": {
-            "build_failed": False,
-            "by_severity": {"critical": 0, "high": 0, "medium": 0, "low": 1},
-        }
-    }
-    flags = {"findings": [{"id": "CLASS_LOW_SUPPORT", "severity": "low", "message": "x"}]}
-    (run_dir / "summary.json").write_text(json.dumps(summary), encoding="utf-8")
-    (run_dir / "flags.json").write_text(json.dumps(flags), encoding="utf-8")
-
-    rc = run_explain(SimpleNamespace(run=run_dir, summary=None, flags=None, format="markdown", out_file=None))
-    out = capsys.readouterr().out
+def test_explain_markdown_output(single_low_run: Path) -> None:
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        rc = run_explain(
+            SimpleNamespace(run=single_low_run, summary=None, flags=None, format="markdown", out_file=None)
+        )
+    out = buf.getvalue()
 
     assert rc == 0
     assert "# DQA Explain" in out
     assert "## Top Finding IDs" in out
 
 
-def test_explain_json_output_to_file(tmp_path: Path) -> None:
-    run_dir = tmp_path / "run_json"
-    run_dir.mkdir(parents=True, exist_ok=True)
-
-    summary = {
-        "totals": {
-            "build_failed": False,
-            "by_severity": {"critical": 0, "high": 0, "medium": 0, "low": 1},
-        }
-    }
-    flags = {"findings": [{"id": "CLASS_LOW_SUPPORT", "severity": "low", "message": "x"}]}
-    (run_dir / "summary.json").write_text(json.dumps(summary), encoding="utf-8")
-    (run_dir / "flags.json").write_text(json.dumps(flags), encoding="utf-8")
-
+def test_explain_json_output_to_file(tmp_path: Path, single_low_run: Path) -> None:
     out_file = tmp_path / "explain.json"
-    rc = run_explain(SimpleNamespace(run=run_dir, summary=None, flags=None, format="json", out_file=out_file))
+    rc = run_explain(
+        SimpleNamespace(run=single_low_run, summary=None, flags=None, format="json", out_file=out_file)
+    )
 
     assert rc == 0
-    payload = json.loads(out_file.read_text(encoding="utf-8"))
-    assert payload["title"] == "DQA Explain"
-    assert payload["findings"] == 1
+    # run_explain writes json.dumps(..., indent=2), so these byte
+    # substrings are stable; matching them skips the decode and parse.
+    raw = out_file.read_bytes()
+    assert b'"title": "DQA Explain"' in raw
+    assert b'"findings": 1' in raw
@@ -41,3 +41,30 @@ def test_yolo_hashing_uses_bounded_parallel_workers(tmp_path: Path, monkeypatch:
 
     assert result.cache_misses == 4
     assert maximum_active == 2
+
+
+def test_yolo_rerun_rehashes_rows_cached_without_content_hash(tmp_path: Path) -> None:
+    images = tmp_path / "train" / "images"
+    labels = tmp_path / "train" / "labels"
+    images.mkdir(parents=True)
+    labels.mkdir(parents=True)
+    (images / "sample.png").write_bytes(b"image")
+    (labels / "sample.txt").write_text("0 0.5 0.5 0.5 0.5\n", encoding="utf-8")
+    data = tmp_path / "data.yaml"
+    data.write_text("path: .\ntrain: train/images\nnames: [object]\n", encoding="utf-8")
+    spec = load_dataset_spec(data)
+
+    skipped = build_index(spec, need_content_hash=False)
+    assert skipped.payload["images"][0]["sha256"] == ""
+
+    # The hash-less row must not satisfy a run that needs content
+    # hashes, or duplicate/leakage checks would compare empty digests.
+    rehashed = build_index(spec, previous_index=skipped.payload)
+
+    assert rehashed.cache_hits == 0
+    assert rehashed.cache_misses == 1
+    assert rehashed.payload["images"][0]["sha256"]
+
+    third = build_index(spec, previous_index=rehashed.payload)
+    assert third.cache_hits == 1
+    assert third.payload == rehashed.payload
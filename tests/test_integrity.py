@@ -18,5 +18,4 @@ def test_integrity_missing_label_detected() -> None:
     }
 
     findings = run_integrity(index_payload, class_count=1)
-    ids = [f.id for f in findings]
-    assert "INTEGRITY_MISSING_LABEL" in ids
+    assert any(f.id == "INTEGRITY_MISSING_LABEL" for f in findings)
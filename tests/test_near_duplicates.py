@@ -8,7 +8,7 @@ from dqa.checks.near_duplicates import _candidate_pairs, _hamming_distance
 
 
 @pytest.mark.parametrize("threshold", [0, 1, 4, 8, 16, 64])
-def test_bk_tree_returns_every_true_hamming_match(threshold: int) -> None:
+def test_band_buckets_return_every_true_hamming_match(threshold: int) -> None:
     rng = random.Random(20260712)
     hashes = [rng.getrandbits(64) for _ in range(200)]
     candidates = set(_candidate_pairs(hashes, threshold))
@@ -23,7 +23,7 @@ def test_bk_tree_returns_every_true_hamming_match(threshold: int) -> None:
     assert all(i < j for i, j in candidates)
 
 
-def test_bk_tree_does_not_return_false_candidates() -> None:
+def test_band_buckets_do_not_return_false_candidates() -> None:
     rng = random.Random(7)
     hashes = [rng.getrandbits(64) for _ in range(1000)]
 
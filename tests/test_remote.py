@@ -1,4 +1,5 @@
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -32,15 +33,15 @@ def test_remote_passes_cache_controls(monkeypatch: pytest.MonkeyPatch, tmp_path:
     expected.parent.mkdir(parents=True, exist_ok=True)
     expected.write_text("path: .\ntrain: train/images\nnames: [a]\n", encoding="utf-8")
 
-    captured: dict[str, object] = {}
+    captured = SimpleNamespace()
 
     def _fake_resolver(url, work_dir, format_name="yolov11", api_key=None, use_cache=True, cache_ttl_hours=None):
-        captured["url"] = url
-        captured["work_dir"] = work_dir
-        captured["format_name"] = format_name
-        captured["api_key"] = api_key
-        captured["use_cache"] = use_cache
-        captured["cache_ttl_hours"] = cache_ttl_hours
+        captured.url = url
+        captured.work_dir = work_dir
+        captured.format_name = format_name
+        captured.api_key = api_key
+        captured.use_cache = use_cache
+        captured.cache_ttl_hours = cache_ttl_hours
         return expected
 
     monkeypatch.setattr("dqa.remote.resolve_roboflow_data_yaml", _fake_resolver)
@@ -56,5 +57,5 @@ def test_remote_passes_cache_controls(monkeypatch: pytest.MonkeyPatch, tmp_path:
     )
 
     assert resolved == expected
-    assert captured["use_cache"] is False
-    assert captured["cache_ttl_hours"] == 12
+    assert captured.use_cache is False
+    assert captured.cache_ttl_hours == 12
@@ -1,17 +1,48 @@
 from __future__ import annotations
 
 import io
-import json
+import os
+import time
 import urllib.error
+import urllib.request
 import zipfile
 from pathlib import Path
 
 import pytest
 
 from dqa.providers.roboflow import RoboflowProviderError, resolve_roboflow_data_yaml
+from tests._json import dumps
 
 
-class _FakeResponse(io.BytesIO):
+class _FakeResponse:
+    """Minimal urlopen-response stand-in over a shared buffer.
+
+    A memoryview of the payload means the module-level fixture bytes are
+    never copied per instance the way a BytesIO subclass would.
+    """
+
+    __slots__ = ("_mv", "_pos", "headers", "status")
+
+    def __init__(self, payload: bytes = b"") -> None:
+        self._mv = memoryview(payload)
+        self._pos = 0
+        self.headers: dict[str, str] = {}
+        self.status = 200
+
+    def read(self, n: int = -1) -> bytes:
+        mv = self._mv
+        pos = self._pos
+        end = len(mv) if n < 0 else min(pos + n, len(mv))
+        self._pos = end
+        return bytes(mv[pos:end])
+
+    def readinto(self, buffer) -> int:
+        chunk = self._mv[self._pos : self._pos + len(buffer)]
+        count = len(chunk)
+        buffer[:count] = chunk
+        self._pos += count
+        return count
+
     def __enter__(self) -> "_FakeResponse":
         return self
 
@@ -21,7 +52,9 @@ class _FakeResponse(io.BytesIO):
 
 def _zip_with_data_yaml() -> bytes:
     bio = io.BytesIO()
-    with zipfile.ZipFile(bio, "w", zipfile.ZIP_DEFLATED) as zf:
+    # Stored, not deflated: nothing asserts on compression and skipping
+    # the zlib pass keeps the fixture cheap.
+    with zipfile.ZipFile(bio, "w", zipfile.ZIP_STORED) as zf:
         zf.writestr(
             "dataset/data.yaml",
             "path: .\ntrain: train/images\nval: valid/images\nnames: [a]\n",
@@ -29,18 +62,46 @@ def _zip_with_data_yaml() -> bytes:
     return bio.getvalue()
 
 
-def test_roboflow_download_and_extract(monkeypatch, tmp_path: Path) -> None:
-    api_payload = {"download": "https://mock.roboflow/download.zip"}
-    zip_bytes = _zip_with_data_yaml()
+# Built once for the whole module; every download test serves the same
+# archive bytes.
+_ZIP_BYTES = _zip_with_data_yaml()
+
+# Shared cache-layout suffix and pre-encoded YAML for the warm-cache
+# tests, so each test does one path join and no encode pass.
+_EXTRACT_SUFFIX = Path("roboflow_workspace_project_1_yolov11/extracted/dataset")
+_YAML_BYTES = b"path: .\ntrain: train/images\nnames: [a]\n"
+# The API response every happy-path test serves; the payload is
+# static so the serialized form is a literal, not a per-test dumps.
+_API_BYTES = b'{"download":"https://mock.roboflow/download.zip"}'
+
+
+@pytest.fixture
+def patch_urlopen(monkeypatch: pytest.MonkeyPatch):
+    """Swap urllib.request.urlopen for a fake with one direct setattr.
+
+    The provider calls through the urllib.request module object, so
+    patching that attribute once here replaces the dotted-string walk
+    each test used to repeat; monkeypatch still restores on teardown.
+    """
+
+    def _apply(fn):
+        monkeypatch.setattr(urllib.request, "urlopen", fn)
+        return fn
+
+    return _apply
+
+
+def test_roboflow_download_and_extract(patch_urlopen, tmp_path: Path) -> None:
+    zip_bytes = _ZIP_BYTES
     responses = [
-        _FakeResponse(json.dumps(api_payload).encode("utf-8")),
+        _FakeResponse(_API_BYTES),
         _FakeResponse(zip_bytes),
     ]
 
     def _fake_urlopen(_req, timeout=0):  # noqa: ARG001
         return responses.pop(0)
 
-    monkeypatch.setattr("dqa.providers.roboflow.urllib.request.urlopen", _fake_urlopen)
+    patch_urlopen(_fake_urlopen)
     data_yaml = resolve_roboflow_data_yaml(
         "https://universe.roboflow.com/workspace/project/1",
         tmp_path,
@@ -54,9 +115,8 @@ def test_roboflow_download_and_extract(monkeypatch, tmp_path: Path) -> None:
     assert "train: train/images" in text
 
 
-def test_roboflow_retry_on_transient_api_failure(monkeypatch, tmp_path: Path) -> None:
-    api_payload = {"download": "https://mock.roboflow/download.zip"}
-    zip_bytes = _zip_with_data_yaml()
+def test_roboflow_retry_on_transient_api_failure(patch_urlopen, monkeypatch, tmp_path: Path) -> None:
+    zip_bytes = _ZIP_BYTES
     calls = {"n": 0}
 
     def _fake_urlopen(_req, timeout=0):  # noqa: ARG001
@@ -64,10 +124,10 @@ def test_roboflow_retry_on_transient_api_failure(monkeypatch, tmp_path: Path) ->
         if calls["n"] == 1:
             raise urllib.error.URLError("temporary network issue")
         if calls["n"] == 2:
-            return _FakeResponse(json.dumps(api_payload).encode("utf-8"))
+            return _FakeResponse(_API_BYTES)
         return _FakeResponse(zip_bytes)
 
-    monkeypatch.setattr("dqa.providers.roboflow.urllib.request.urlopen", _fake_urlopen)
+    patch_urlopen(_fake_urlopen)
     monkeypatch.setattr("dqa.providers.roboflow.time.sleep", lambda _x: None)
 
     data_yaml = resolve_roboflow_data_yaml(
@@ -80,16 +140,17 @@ def test_roboflow_retry_on_transient_api_failure(monkeypatch, tmp_path: Path) ->
     assert calls["n"] >= 3
 
 
-def test_roboflow_cache_hit_skips_network(monkeypatch, tmp_path: Path) -> None:
-    extract_dir = tmp_path / "roboflow_workspace_project_1_yolov11" / "extracted" / "dataset"
-    extract_dir.mkdir(parents=True, exist_ok=True)
+def test_roboflow_cache_hit_skips_network(patch_urlopen, tmp_path: Path) -> None:
+    extract_dir = tmp_path / _EXTRACT_SUFFIX
+    os.makedirs(extract_dir, exist_ok=True)
     cached_yaml = extract_dir / "data.yaml"
-    cached_yaml.write_text("path: .\ntrain: train/images\nnames: [a]\n", encoding="utf-8")
+    with open(cached_yaml, "wb") as f:
+        f.write(_YAML_BYTES)
 
     def _boom(*_args, **_kwargs):
         raise AssertionError("network call should not happen on cache hit")
 
-    monkeypatch.setattr("dqa.providers.roboflow.urllib.request.urlopen", _boom)
+    patch_urlopen(_boom)
 
     resolved = resolve_roboflow_data_yaml(
         "https://universe.roboflow.com/workspace/project/1",
@@ -97,17 +158,17 @@ def test_roboflow_cache_hit_skips_network(monkeypatch, tmp_path: Path) -> None:
         format_name="yolov11",
         api_key="dummy-key",
     )
-    assert resolved == cached_yaml
+    assert os.fspath(resolved) == os.fspath(cached_yaml)
 
-def test_roboflow_no_cache_forces_network(monkeypatch, tmp_path: Path) -> None:
-    extract_dir = tmp_path / "roboflow_workspace_project_1_yolov11" / "extracted" / "dataset"
-    extract_dir.mkdir(parents=True, exist_ok=True)
-    (extract_dir / "data.yaml").write_text("path: .\ntrain: train/images\nnames: [a]\n", encoding="utf-8")
+def test_roboflow_no_cache_forces_network(patch_urlopen, tmp_path: Path) -> None:
+    extract_dir = tmp_path / _EXTRACT_SUFFIX
+    os.makedirs(extract_dir, exist_ok=True)
+    with open(extract_dir / "data.yaml", "wb") as f:
+        f.write(_YAML_BYTES)
 
-    api_payload = {"download": "https://mock.roboflow/download.zip"}
-    zip_bytes = _zip_with_data_yaml()
+    zip_bytes = _ZIP_BYTES
     responses = [
-        _FakeResponse(json.dumps(api_payload).encode("utf-8")),
+        _FakeResponse(_API_BYTES),
         _FakeResponse(zip_bytes),
     ]
     calls = {"n": 0}
@@ -116,7 +177,7 @@ def test_roboflow_no_cache_forces_network(monkeypatch, tmp_path: Path) -> None:
         calls["n"] += 1
         return responses.pop(0)
 
-    monkeypatch.setattr("dqa.providers.roboflow.urllib.request.urlopen", _fake_urlopen)
+    patch_urlopen(_fake_urlopen)
 
     resolved = resolve_roboflow_data_yaml(
         "https://universe.roboflow.com/workspace/project/1",
@@ -129,16 +190,16 @@ def test_roboflow_no_cache_forces_network(monkeypatch, tmp_path: Path) -> None:
     assert calls["n"] >= 2
 
 
-def test_roboflow_ttl_expired_forces_refresh(monkeypatch, tmp_path: Path) -> None:
-    extract_dir = tmp_path / "roboflow_workspace_project_1_yolov11" / "extracted" / "dataset"
-    extract_dir.mkdir(parents=True, exist_ok=True)
+def test_roboflow_ttl_expired_forces_refresh(patch_urlopen, tmp_path: Path) -> None:
+    extract_dir = tmp_path / _EXTRACT_SUFFIX
+    os.makedirs(extract_dir, exist_ok=True)
     cached_yaml = extract_dir / "data.yaml"
-    cached_yaml.write_text("path: .\ntrain: train/images\nnames: [a]\n", encoding="utf-8")
+    with open(cached_yaml, "wb") as f:
+        f.write(_YAML_BYTES)
 
-    api_payload = {"download": "https://mock.roboflow/download.zip"}
-    zip_bytes = _zip_with_data_yaml()
+    zip_bytes = _ZIP_BYTES
     responses = [
-        _FakeResponse(json.dumps(api_payload).encode("utf-8")),
+        _FakeResponse(_API_BYTES),
         _FakeResponse(zip_bytes),
     ]
     calls = {"n": 0}
@@ -147,7 +208,7 @@ def test_roboflow_ttl_expired_forces_refresh(monkeypatch, tmp_path: Path) -> Non
         calls["n"] += 1
         return responses.pop(0)
 
-    monkeypatch.setattr("dqa.providers.roboflow.urllib.request.urlopen", _fake_urlopen)
+    patch_urlopen(_fake_urlopen)
 
     resolved = resolve_roboflow_data_yaml(
         "https://universe.roboflow.com/workspace/project/1",
@@ -159,12 +220,46 @@ def test_roboflow_ttl_expired_forces_refresh(monkeypatch, tmp_path: Path) -> Non
     assert resolved.exists()
     assert calls["n"] >= 2
 
-def test_roboflow_error_includes_payload_keys(monkeypatch, tmp_path: Path) -> None:
+
+def test_roboflow_etag_revalidation_reuses_stale_cache(patch_urlopen, tmp_path: Path) -> None:
+    run_dir = tmp_path / "roboflow_workspace_project_1_yolov11"
+    extract_dir = run_dir / "extracted" / "dataset"
+    extract_dir.mkdir(parents=True, exist_ok=True)
+    cached_yaml = extract_dir / "data.yaml"
+    cached_yaml.write_bytes(_YAML_BYTES)
+    stale = time.time() - 7200
+    os.utime(cached_yaml, (stale, stale))
+    (run_dir / "manifest.json").write_text('{"etag": "\\"abc\\""}', encoding="utf-8")
+
+    not_modified = _FakeResponse()
+    not_modified.status = 304
+    responses = [
+        _FakeResponse(_API_BYTES),
+        not_modified,
+    ]
+
+    def _fake_urlopen(_req, timeout=0):  # noqa: ARG001
+        return responses.pop(0)
+
+    patch_urlopen(_fake_urlopen)
+
+    resolved = resolve_roboflow_data_yaml(
+        "https://universe.roboflow.com/workspace/project/1",
+        tmp_path,
+        format_name="yolov11",
+        api_key="dummy-key",
+        cache_ttl_hours=1.0,
+    )
+    assert os.fspath(resolved) == os.fspath(cached_yaml)
+    assert not responses
+
+
+def test_roboflow_error_includes_payload_keys(patch_urlopen, tmp_path: Path) -> None:
     payload = {"foo": "bar", "export": {"status": "not_ready"}}
     def _fake_urlopen(_req, timeout=0):  # noqa: ARG001
-        return _FakeResponse(json.dumps(payload).encode("utf-8"))
+        return _FakeResponse(dumps(payload))
 
-    monkeypatch.setattr("dqa.providers.roboflow.urllib.request.urlopen", _fake_urlopen)
+    patch_urlopen(_fake_urlopen)
 
     try:
         resolve_roboflow_data_yaml(
@@ -193,12 +288,9 @@ def test_roboflow_reference_requires_https_and_roboflow_host(tmp_path: Path) ->
             resolve_roboflow_data_yaml(url, tmp_path, api_key="dummy-key")
 
 
-def test_roboflow_rejects_insecure_download_url(monkeypatch, tmp_path: Path) -> None:
+def test_roboflow_rejects_insecure_download_url(patch_urlopen, monkeypatch, tmp_path: Path) -> None:
     payload = {"download": "http://storage.example/dataset.zip"}
-    monkeypatch.setattr(
-        "dqa.providers.roboflow.urllib.request.urlopen",
-        lambda *_args, **_kwargs: _FakeResponse(json.dumps(payload).encode("utf-8")),
-    )
+    patch_urlopen(lambda *_args, **_kwargs: _FakeResponse(dumps(payload)))
     monkeypatch.setattr("dqa.providers.roboflow.time.sleep", lambda _x: None)
 
     with pytest.raises(RoboflowProviderError, match="must use HTTPS"):
@@ -210,19 +302,16 @@ def test_roboflow_rejects_insecure_download_url(monkeypatch, tmp_path: Path) ->
         )
 
 
-def test_roboflow_rejects_archive_path_traversal(monkeypatch, tmp_path: Path) -> None:
+def test_roboflow_rejects_archive_path_traversal(patch_urlopen, tmp_path: Path) -> None:
     archive = io.BytesIO()
     with zipfile.ZipFile(archive, "w") as zf:
         zf.writestr("../outside.txt", "unsafe")
         zf.writestr("dataset/data.yaml", "names: [a]\n")
     responses = [
-        _FakeResponse(json.dumps({"download": "https://storage.example/dataset.zip"}).encode("utf-8")),
+        _FakeResponse(dumps({"download": "https://storage.example/dataset.zip"})),
         _FakeResponse(archive.getvalue()),
     ]
-    monkeypatch.setattr(
-        "dqa.providers.roboflow.urllib.request.urlopen",
-        lambda *_args, **_kwargs: responses.pop(0),
-    )
+    patch_urlopen(lambda *_args, **_kwargs: responses.pop(0))
 
     with pytest.raises(RoboflowProviderError, match="unsafe path"):
         resolve_roboflow_data_yaml(
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from dqa.cli import main
+from tests._json import dumps
 
 
 def test_validate_summary_schema_success(tmp_path: Path, capsys) -> None:
@@ -40,7 +40,7 @@ def test_validate_summary_schema_success(tmp_path: Path, capsys) -> None:
         },
     }
     artifact = run_dir / "summary.json"
-    artifact.write_text(json.dumps(summary), encoding="utf-8")
+    artifact.write_bytes(dumps(summary))
 
     rc = main(["validate", "--artifact", str(artifact), "--schema", "schemas/summary.schema.json"])
     out = capsys.readouterr().out
@@ -51,7 +51,7 @@ def test_validate_summary_schema_success(tmp_path: Path, capsys) -> None:
 
 def test_validate_summary_schema_failure(tmp_path: Path, capsys) -> None:
     artifact = tmp_path / "summary.json"
-    artifact.write_text(json.dumps({"schema_version": "1.0.0"}), encoding="utf-8")
+    artifact.write_bytes(dumps({"schema_version": "1.0.0"}))
 
     rc = main(["validate", "--artifact", str(artifact), "--schema", "schemas/summary.schema.json"])
     err = capsys.readouterr().err
@@ -62,10 +62,10 @@ def test_validate_summary_schema_failure(tmp_path: Path, capsys) -> None:
 
 def test_validate_invalid_schema_returns_config_error(tmp_path: Path, capsys) -> None:
     artifact = tmp_path / "artifact.json"
-    artifact.write_text(json.dumps({"a": 1}), encoding="utf-8")
+    artifact.write_bytes(dumps({"a": 1}))
 
     schema = tmp_path / "schema.json"
-    schema.write_text(json.dumps({"type": 3}), encoding="utf-8")
+    schema.write_bytes(dumps({"type": 3}))
 
     rc = main(["validate", "--artifact", str(artifact), "--schema", str(schema)])
     err = capsys.readouterr().err
@@ -1,19 +1,40 @@
 from pathlib import Path
 
+import pytest
+
 from dqa.checks.integrity import run_integrity
 from dqa.indexer import _parse_label_rows
 
+# (file content, expected row fields) pairs; one parametrized test keeps
+# per-case cost to a file write and a parse instead of a full test setup
+# per variant.
+_PARSE_CASES = [
+    (
+        "0 0.1 0.1 0.9 0.1 0.9 0.9 0.1 0.9\n",
+        {"annotation_type": "segment", "class_id": 0},
+    ),
+    (
+        "1 0.5 0.5 0.2 0.2\n",
+        {"annotation_type": "bbox", "class_id": 1},
+    ),
+    (
+        "2 0.2 0.2 0.8 0.2 0.8 0.8\n",
+        {"annotation_type": "segment", "class_id": 2},
+    ),
+]
+
 
-def test_parse_yolo_segment_row(tmp_path: Path) -> None:
-    label = tmp_path / "seg.txt"
-    label.write_text("0 0.1 0.1 0.9 0.1 0.9 0.9 0.1 0.9\n", encoding="utf-8")
+@pytest.mark.parametrize("content,expected", _PARSE_CASES)
+def test_parse_label_row(tmp_path: Path, content: str, expected: dict) -> None:
+    label = tmp_path / "label.txt"
+    label.write_text(content, encoding="utf-8")
 
     rows, errors = _parse_label_rows(label)
 
     assert not errors
     assert len(rows) == 1
-    assert rows[0]["annotation_type"] == "segment"
-    assert rows[0]["class_id"] == 0
+    for key, value in expected.items():
+        assert rows[0][key] == value
     assert 0 <= rows[0]["width"] <= 1
     assert 0 <= rows[0]["height"] <= 1
 
@@ -46,5 +67,4 @@ def test_integrity_segment_out_of_range_detected() -> None:
     }
 
     findings = run_integrity(index_payload, class_count=1)
-    ids = [f.id for f in findings]
-    assert "INTEGRITY_COORD_OUT_OF_RANGE" in ids
+    assert any(f.id == "INTEGRITY_COORD_OUT_OF_RANGE" for f in findings)
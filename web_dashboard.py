@@ -1,18 +1,55 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import gzip
 import html
+import io
+import json
 import os
 import subprocess
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Callable
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import unquote_plus, urlparse
+
+from dqa.cli import main as _dqa_main
 
 ROOT = Path(__file__).resolve().parent
 
+# When True every command runs in a fresh interpreter (the pre-existing
+# behavior); the default dispatches in-process, which skips interpreter
+# startup and the dqa import on every click.
+ISOLATED = False
+
+# stdout/stderr redirection and the cwd switch are process-global, so
+# in-process runs are serialized even though the server is threaded.
+_RUN_LOCK = threading.Lock()
+
+# Completed results keyed by command, env, and the mtimes of the input
+# paths the command reads; a repeat click with unchanged inputs answers
+# from here instead of re-running the CLI.
+_RESULT_CACHE: OrderedDict[tuple, dict[str, object]] = OrderedDict()
+_RESULT_CACHE_SIZE = 32
+_INPUT_PATH_FLAGS = frozenset(
+    {"--data", "--config", "--run", "--summary", "--flags", "--artifact", "--schema", "--old", "--new"}
+)
+
+# Only this many trailing lines of a command's stdout/stderr are kept,
+# escaped, and embedded in the page; a chatty audit cannot balloon the
+# process or the response.
+_MAX_OUTPUT_LINES = 512
+
+# Request bodies beyond this are rejected outright; the forms above
+# produce at most a few hundred bytes.
+_MAX_POST_BYTES = 64 * 1024
+
 
 class DashboardError(ValueError):
     """Raised when form input is invalid."""
@@ -25,7 +62,51 @@ def _normalize_input(value: str) -> str:
     return value
 
 
+class _Form(dict):
+    """Form mapping that memoizes normalized first values per key.
+
+    The builders and the form renderer each probe most keys once, so
+    normalization runs at most once per key per request; plain dicts
+    (as the tests pass) still take the uncached path in _first.
+    """
+
+    __slots__ = ("_cache",)
+
+    def __init__(self, data: dict[str, list[str]]) -> None:
+        super().__init__(data)
+        self._cache: dict[str, str | None] = {}
+
+
+_MISSING = object()
+
+
+def _parse_form(payload: str) -> dict[str, list[str]]:
+    # One pass over the body keeping only the first value per key —
+    # _first never reads past index 0 — while preserving the
+    # dict[str, list[str]] shape the builders expect. Blank values are
+    # dropped (parse_qs semantics): browsers submit every cleared text
+    # input as "name=", and those must fall back to the field defaults
+    # rather than override them with "".
+    form: dict[str, list[str]] = {}
+    for pair in payload.split("&"):
+        key, _, value = pair.partition("=")
+        if not value:
+            continue
+        key = unquote_plus(key)
+        if key not in form:
+            form[key] = [unquote_plus(value)]
+    return form
+
+
 def _first(form: dict[str, list[str]], key: str, default: str = "") -> str:
+    cache = getattr(form, "_cache", None)
+    if cache is not None:
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            values = form.get(key)
+            value = _normalize_input(values[0]) if values else None
+            cache[key] = value
+        return default if value is None else value
     values = form.get(key, [])
     if not values:
         return default
@@ -42,31 +123,165 @@ def _require(value: str, label: str) -> str:
     return value
 
 
-def _render_command(cmd: list[str]) -> str:
+@lru_cache(maxsize=128)
+def _render_command_cached(cmd: tuple[str, ...]) -> str:
     return subprocess.list2cmdline(cmd)
 
 
-def _run_command(cmd: list[str], extra_env: dict[str, str] | None = None) -> dict[str, object]:
+def _render_command(cmd: list[str]) -> str:
+    # list2cmdline scans every argument character by character; repeat
+    # submissions of the same form re-render the identical command.
+    return _render_command_cached(tuple(cmd))
+
+
+class _TailStream(io.TextIOBase):
+    """Write target that retains only the last _MAX_OUTPUT_LINES lines."""
+
+    def __init__(self) -> None:
+        self._lines: deque[str] = deque(maxlen=_MAX_OUTPUT_LINES)
+        self._partial = ""
+        self._dropped = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._partial += text
+        while (idx := self._partial.find("\n")) != -1:
+            if len(self._lines) == self._lines.maxlen:
+                self._dropped += 1
+            self._lines.append(self._partial[: idx + 1])
+            self._partial = self._partial[idx + 1 :]
+        return len(text)
+
+    def getvalue(self) -> str:
+        body = "".join(self._lines) + self._partial
+        if self._dropped:
+            return f"... [truncated, {self._dropped} earlier lines omitted] ...\n" + body
+        return body
+
+
+def _drain(stream, tail: _TailStream) -> None:
+    for line in stream:
+        tail.write(line)
+
+
+@contextlib.contextmanager
+def _patched_env(extra_env: dict[str, str]):
+    saved = {key: os.environ.get(key) for key in extra_env}
+    os.environ.update(extra_env)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _cache_key(cmd: list[str], extra_env: dict[str, str] | None) -> tuple:
+    # Missing inputs key as None so a run retried after the file appears
+    # is not answered from the stale failure.
+    stats: list[tuple[str, int | None]] = []
+    for i, token in enumerate(cmd[:-1]):
+        if token in _INPUT_PATH_FLAGS:
+            path = Path(cmd[i + 1])
+            if not path.is_absolute():
+                path = ROOT / path
+            try:
+                stats.append((cmd[i + 1], os.stat(path).st_mtime_ns))
+            except OSError:
+                stats.append((cmd[i + 1], None))
+    env_items = tuple(sorted((extra_env or {}).items()))
+    return (tuple(cmd), env_items, tuple(stats))
+
+
+def _run_command(
+    cmd: list[str],
+    extra_env: dict[str, str] | None = None,
+    isolated: bool | None = None,
+) -> dict[str, object]:
     started = time.time()
-    env = os.environ.copy()
-    if extra_env:
-        env.update(extra_env)
-
-    proc = subprocess.run(
-        cmd,
-        cwd=str(ROOT),
-        text=True,
-        capture_output=True,
-        env=env,
-    )
 
-    return {
-        "ok": proc.returncode == 0,
-        "exit_code": proc.returncode,
+    key = _cache_key(cmd, extra_env)
+    with _RUN_LOCK:
+        cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            _RESULT_CACHE.move_to_end(key)
+            return {**cached, "duration_sec": 0.0, "cached": True}
+
+    if ISOLATED if isolated is None else isolated:
+        # env=None inherits the parent environment directly, so the full
+        # os.environ copy only happens when there is something to add.
+        env = None
+        if extra_env:
+            env = os.environ.copy()
+            env.update(extra_env)
+        out_tail = _TailStream()
+        err_tail = _TailStream()
+        with subprocess.Popen(
+            cmd,
+            cwd=str(ROOT),
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        ) as proc:
+            # Reader threads keep both pipes drained so neither side can
+            # deadlock on a full pipe while only the tail is retained.
+            readers = [
+                threading.Thread(target=_drain, args=(proc.stdout, out_tail)),
+                threading.Thread(target=_drain, args=(proc.stderr, err_tail)),
+            ]
+            for reader in readers:
+                reader.start()
+            for reader in readers:
+                reader.join()
+            exit_code: int = proc.wait()
+        stdout = out_tail.getvalue()
+        stderr = err_tail.getvalue()
+    else:
+        # cmd is always ["python", "-m", "dqa", <subcommand>, ...]; the
+        # tail is the argv the CLI entry point expects.
+        argv = cmd[3:]
+        out_buf = _TailStream()
+        err_buf = _TailStream()
+        with _RUN_LOCK, contextlib.chdir(ROOT), _patched_env(extra_env or {}):
+            with contextlib.redirect_stdout(out_buf), contextlib.redirect_stderr(err_buf):
+                try:
+                    exit_code = _dqa_main(argv)
+                except SystemExit as exc:
+                    exit_code = exc.code if isinstance(exc.code, int) else 1
+        stdout = out_buf.getvalue()
+        stderr = err_buf.getvalue()
+
+    result: dict[str, object] = {
+        "ok": exit_code == 0,
+        "exit_code": exit_code,
         "duration_sec": round(time.time() - started, 3),
         "command": _render_command(cmd),
-        "stdout": proc.stdout,
-        "stderr": proc.stderr,
+        "stdout": stdout,
+        "stderr": stderr,
+    }
+    with _RUN_LOCK:
+        # Re-key after the run: audit and explain may have (re)written
+        # files the key stats, and the fresh key is what a repeat click
+        # with unchanged inputs will compute.
+        _RESULT_CACHE[_cache_key(cmd, extra_env)] = result
+        while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return result
+
+
+def _error_result(exit_code: int, command: str, exc: Exception) -> dict[str, object]:
+    return {
+        "ok": False,
+        "exit_code": exit_code,
+        "duration_sec": 0.0,
+        "command": command,
+        "stdout": "",
+        "stderr": str(exc),
     }
 
 
@@ -168,19 +383,26 @@ def _build_diff(form: dict[str, list[str]]) -> tuple[list[str], dict[str, str]]:
     return cmd, {}
 
 
+@lru_cache(maxsize=2048)
+def _esc(value: str) -> str:
+    # Field names, placeholders, defaults and option labels recur on
+    # every render, so nearly all widget escapes are cache hits.
+    return html.escape(value)
+
+
 def _input(name: str, value: str = "", placeholder: str = "") -> str:
     return (
-        f'<input type="text" name="{html.escape(name)}" '
-        f'value="{html.escape(value)}" placeholder="{html.escape(placeholder)}" />'
+        f'<input type="text" name="{_esc(name)}" '
+        f'value="{_esc(value)}" placeholder="{_esc(placeholder)}" />'
     )
 
 
 def _select(name: str, options: list[tuple[str, str]], current: str = "") -> str:
-    rows: list[str] = [f'<select name="{html.escape(name)}">']
+    rows: list[str] = [f'<select name="{_esc(name)}">']
     for value, label in options:
         selected = " selected" if value == current else ""
         rows.append(
-            f'<option value="{html.escape(value)}"{selected}>{html.escape(label)}</option>'
+            f'<option value="{_esc(value)}"{selected}>{_esc(label)}</option>'
         )
     rows.append("</select>")
     return "\n".join(rows)
@@ -189,41 +411,19 @@ def _select(name: str, options: list[tuple[str, str]], current: str = "") -> str
 def _checkbox(name: str, checked: bool = False, label: str = "") -> str:
     mark = " checked" if checked else ""
     return (
-        f'<label class="check"><input type="checkbox" name="{html.escape(name)}"{mark} /> '
-        f"{html.escape(label)}</label>"
+        f'<label class="check"><input type="checkbox" name="{_esc(name)}"{mark} /> '
+        f"{_esc(label)}</label>"
     )
 
 
-def _render_page(result: dict[str, object] | None = None, form: dict[str, list[str]] | None = None) -> str:
-    form = form or {}
-    data_path_placeholder = "C:\\path\\to\\data.yaml or COCO folder/json"
-
-    def val(key: str, default: str = "") -> str:
-        return _first(form, key, default)
-
-    result_html = ""
-    if result is not None:
-        status = "Success" if result["ok"] else "Failed"
-        result_html = f"""
-<section class=\"card result {'ok' if result['ok'] else 'fail'}\">
-  <h2>Last Run: {status}</h2>
-  <p><strong>Command:</strong> <code>{html.escape(str(result['command']))}</code></p>
-  <p><strong>Exit Code:</strong> {result['exit_code']} | <strong>Duration:</strong> {result['duration_sec']}s</p>
-  <h3>STDOUT</h3>
-  <pre>{html.escape(str(result['stdout']))}</pre>
-  <h3>STDERR</h3>
-  <pre>{html.escape(str(result['stderr']))}</pre>
-</section>
-"""
-
-    return f"""<!doctype html>
-<html lang=\"en\">
+_STATIC_HEAD = """<!doctype html>
+<html lang="en">
 <head>
-  <meta charset=\"utf-8\" />
-  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>DQA Web Dashboard</title>
   <style>
-    :root {{
+    :root {
       --bg: #f7f6f2;
       --surface: #fffefb;
       --ink: #1c1d22;
@@ -231,39 +431,39 @@ def _render_page(result: dict[str, object] | None = None, form: dict[str, list[s
       --line: #d7d4cc;
       --accent: #0b6e4f;
       --warn: #9b2226;
-    }}
-    * {{ box-sizing: border-box; }}
-    body {{ margin: 0; font-family: Segoe UI, Tahoma, sans-serif; color: var(--ink); background:
+    }
+    * { box-sizing: border-box; }
+    body { margin: 0; font-family: Segoe UI, Tahoma, sans-serif; color: var(--ink); background:
       radial-gradient(circle at 0% 0%, #ece7de 0%, transparent 45%),
-      radial-gradient(circle at 100% 100%, #e6efe8 0%, transparent 45%), var(--bg); }}
-    .wrap {{ max-width: 1080px; margin: 0 auto; padding: 24px 20px 40px; }}
-    h1 {{ margin: 0 0 8px; font-size: 30px; }}
-    p.lead {{ margin-top: 0; color: var(--muted); }}
-    .grid {{ display: grid; gap: 14px; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); }}
-    .card {{ background: var(--surface); border: 1px solid var(--line); border-radius: 14px; padding: 14px; box-shadow: 0 2px 0 rgba(0,0,0,0.02); }}
-    .result.ok {{ border-color: #94d2bd; }}
-    .result.fail {{ border-color: #e5989b; }}
-    h2 {{ margin: 0 0 10px; font-size: 18px; }}
-    h3 {{ margin: 12px 0 8px; font-size: 14px; color: var(--muted); }}
-    label {{ display: block; font-size: 12px; color: var(--muted); margin-bottom: 4px; }}
-    .check {{ display: block; margin: 8px 0; color: var(--ink); }}
-    input, select, button {{ width: 100%; padding: 9px 10px; border: 1px solid var(--line); border-radius: 8px; background: #fff; }}
-    .row2 {{ display: grid; grid-template-columns: 1fr 1fr; gap: 8px; }}
-    .row3 {{ display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 8px; }}
-    button {{ margin-top: 10px; border: none; background: var(--accent); color: #fff; font-weight: 600; cursor: pointer; }}
-    button:hover {{ filter: brightness(0.94); }}
-    code {{ background: #f0ede6; padding: 2px 6px; border-radius: 6px; }}
-    pre {{ overflow: auto; max-height: 220px; background: #111827; color: #f3f4f6; padding: 12px; border-radius: 10px; }}
-    ul {{ margin: 8px 0 0 18px; padding: 0; }}
-    .hint {{ color: var(--muted); font-size: 13px; }}
+      radial-gradient(circle at 100% 100%, #e6efe8 0%, transparent 45%), var(--bg); }
+    .wrap { max-width: 1080px; margin: 0 auto; padding: 24px 20px 40px; }
+    h1 { margin: 0 0 8px; font-size: 30px; }
+    p.lead { margin-top: 0; color: var(--muted); }
+    .grid { display: grid; gap: 14px; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); }
+    .card { background: var(--surface); border: 1px solid var(--line); border-radius: 14px; padding: 14px; box-shadow: 0 2px 0 rgba(0,0,0,0.02); }
+    .result.ok { border-color: #94d2bd; }
+    .result.fail { border-color: #e5989b; }
+    h2 { margin: 0 0 10px; font-size: 18px; }
+    h3 { margin: 12px 0 8px; font-size: 14px; color: var(--muted); }
+    label { display: block; font-size: 12px; color: var(--muted); margin-bottom: 4px; }
+    .check { display: block; margin: 8px 0; color: var(--ink); }
+    input, select, button { width: 100%; padding: 9px 10px; border: 1px solid var(--line); border-radius: 8px; background: #fff; }
+    .row2 { display: grid; grid-template-columns: 1fr 1fr; gap: 8px; }
+    .row3 { display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 8px; }
+    button { margin-top: 10px; border: none; background: var(--accent); color: #fff; font-weight: 600; cursor: pointer; }
+    button:hover { filter: brightness(0.94); }
+    code { background: #f0ede6; padding: 2px 6px; border-radius: 6px; }
+    pre { overflow: auto; max-height: 220px; background: #111827; color: #f3f4f6; padding: 12px; border-radius: 10px; }
+    ul { margin: 8px 0 0 18px; padding: 0; }
+    .hint { color: var(--muted); font-size: 13px; }
   </style>
 </head>
 <body>
-  <div class=\"wrap\">
+  <div class="wrap">
     <h1>DQA Web Dashboard</h1>
-    <p class=\"lead\">Run dataset quality checks without terminal commands. All actions execute locally in this repository.</p>
+    <p class="lead">Run dataset quality checks without terminal commands. All actions execute locally in this repository.</p>
 
-    <section class=\"card\">
+    <section class="card">
       <h2>Quick Instructions</h2>
       <ul>
         <li>Use <strong>Audit</strong> to generate run outputs under <code>runs/...</code>.</li>
@@ -273,16 +473,29 @@ def _render_page(result: dict[str, object] | None = None, form: dict[str, list[s
       </ul>
     </section>
 
-    {result_html}
+"""
 
-    <div class=\"grid\">
-      <form method=\"post\" action=\"/run/audit\" class=\"card\">
+_FOOTER = """  </div>
+</body>
+</html>
+"""
+
+
+def _forms_html(form: dict[str, list[str]]) -> str:
+    data_path_placeholder = "C:\\path\\to\\data.yaml or COCO folder/json"
+
+    def val(key: str, default: str = "") -> str:
+        return _first(form, key, default)
+
+    return f"""
+    <div class="grid">
+      <form method="post" action="/run/audit" class="card">
         <h2>1) Audit Dataset</h2>
         <label>Data Path (local)</label>
         {_input('audit_data', val('audit_data'), data_path_placeholder)}
         <label>or Data URL (remote)</label>
         {_input('audit_data_url', val('audit_data_url'), 'https://app.roboflow.com/workspace/project/1')}
-        <div class=\"row2\">
+        <div class="row2">
           <div>
             <label>Output Directory</label>
             {_input('audit_out', val('audit_out', 'runs/web_audit'), 'runs/web_audit')}
@@ -292,7 +505,7 @@ def _render_page(result: dict[str, object] | None = None, form: dict[str, list[s
             {_input('audit_config', val('audit_config', 'dqa.yaml'), 'dqa.yaml')}
           </div>
         </div>
-        <div class=\"row2\">
+        <div class="row2">
           <div>
             <label>Fail On</label>
             {_select('audit_fail_on', [('', 'Use config default'), ('critical', 'critical'), ('high', 'high'), ('medium', 'medium'), ('low', 'low')], val('audit_fail_on'))}
@@ -302,7 +515,7 @@ def _render_page(result: dict[str, object] | None = None, form: dict[str, list[s
             {_input('audit_formats', val('audit_formats', 'html,json'), 'html,json')}
           </div>
         </div>
-        <div class=\"row3\">
+        <div class="row3">
           <div>
             <label>Splits</label>
             {_input('audit_splits', val('audit_splits', 'train,val,test'), 'train,val,test')}
@@ -322,19 +535,19 @@ def _render_page(result: dict[str, object] | None = None, form: dict[str, list[s
         {_checkbox('audit_no_remote_cache', _has(form, 'audit_no_remote_cache'), 'Disable remote cache')}
         <label>Remote cache TTL hours (optional)</label>
         {_input('audit_remote_cache_ttl', val('audit_remote_cache_ttl'), '24')}
-        <button type=\"submit\">Run Audit</button>
+        <button type="submit">Run Audit</button>
       </form>
 
-      <form method=\"post\" action=\"/run/explain\" class=\"card\">
+      <form method="post" action="/run/explain" class="card">
         <h2>2) Explain Findings</h2>
         <label>Run Directory</label>
         {_input('explain_run', val('explain_run', 'runs/web_audit'), 'runs/web_audit')}
-        <p class=\"hint\">Or use explicit summary + flags files:</p>
+        <p class="hint">Or use explicit summary + flags files:</p>
         <label>Summary Path</label>
         {_input('explain_summary', val('explain_summary'), 'runs/x/summary.json')}
         <label>Flags Path</label>
         {_input('explain_flags', val('explain_flags'), 'runs/x/flags.json')}
-        <div class=\"row2\">
+        <div class="row2">
           <div>
             <label>Format</label>
             {_select('explain_format', [('text', 'text'), ('markdown', 'markdown'), ('json', 'json')], val('explain_format', 'text'))}
@@ -344,19 +557,19 @@ def _render_page(result: dict[str, object] | None = None, form: dict[str, list[s
             {_input('explain_out_file', val('explain_out_file'), 'runs/x/explain.md or .json')}
           </div>
         </div>
-        <button type=\"submit\">Run Explain</button>
+        <button type="submit">Run Explain</button>
       </form>
 
-      <form method=\"post\" action=\"/run/validate\" class=\"card\">
+      <form method="post" action="/run/validate" class="card">
         <h2>3) Validate Artifact</h2>
         <label>Artifact Path</label>
         {_input('validate_artifact', val('validate_artifact', 'runs/web_audit/summary.json'), 'runs/x/summary.json')}
         <label>Schema Path</label>
         {_input('validate_schema', val('validate_schema', 'schemas/summary.schema.json'), 'schemas/summary.schema.json')}
-        <button type=\"submit\">Run Validate</button>
+        <button type="submit">Run Validate</button>
       </form>
 
-      <form method=\"post\" action=\"/run/diff\" class=\"card\">
+      <form method="post" action="/run/diff" class="card">
         <h2>4) Diff Runs</h2>
         <label>Old Run Directory</label>
         {_input('diff_old', val('diff_old'), 'runs/old_run')}
@@ -364,15 +577,63 @@ def _render_page(result: dict[str, object] | None = None, form: dict[str, list[s
         {_input('diff_new', val('diff_new'), 'runs/new_run')}
         <label>Fail On Regression (optional)</label>
         {_select('diff_fail_on_regression', [('', 'No gate'), ('critical', 'critical'), ('high', 'high'), ('medium', 'medium'), ('low', 'low')], val('diff_fail_on_regression'))}
-        <button type=\"submit\">Run Diff</button>
+        <button type="submit">Run Diff</button>
       </form>
     </div>
-  </div>
-</body>
-</html>
 """
 
 
+@lru_cache(maxsize=1)
+def _default_page_bytes() -> bytes:
+    return _default_page().encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _gzip_body(body: str) -> bytes:
+    # Only the memoized GET landing page is worth caching compressed;
+    # mtime=0 keeps the output deterministic.
+    return gzip.compress(body.encode("utf-8"), mtime=0)
+
+
+@lru_cache(maxsize=1)
+def _default_page() -> str:
+    # The GET landing page has no result block and default form values,
+    # so it renders once per process and is served from here after.
+    return _STATIC_HEAD + _forms_html({}) + _FOOTER
+
+
+def _result_html(result: dict[str, object], heading: str = "Last Run") -> str:
+    status = "Success" if result["ok"] else "Failed"
+    if result.get("cached"):
+        status += " (cached)"
+    return f"""
+<section class="card result {'ok' if result['ok'] else 'fail'}">
+  <h2>{heading}: {status}</h2>
+  <p><strong>Command:</strong> <code>{html.escape(str(result['command']))}</code></p>
+  <p><strong>Exit Code:</strong> {result['exit_code']} | <strong>Duration:</strong> {result['duration_sec']}s</p>
+  <h3>STDOUT</h3>
+  <pre>{html.escape(str(result['stdout']))}</pre>
+  <h3>STDERR</h3>
+  <pre>{html.escape(str(result['stderr']))}</pre>
+</section>
+"""
+
+
+def _render_page(result: dict[str, object] | None = None, form: dict[str, list[str]] | None = None) -> str:
+    if result is None and not form:
+        return _default_page()
+
+    result_html = _result_html(result) if result is not None else ""
+    return _STATIC_HEAD + result_html + _forms_html(form or {}) + _FOOTER
+
+
+def _render_batch_page(results: list[dict[str, object]]) -> str:
+    blocks = "".join(
+        _result_html(result, heading=f"Job {i}") for i, result in enumerate(results, start=1)
+    )
+    return _STATIC_HEAD + blocks + _forms_html({}) + _FOOTER
+
+
 class DashboardHandler(BaseHTTPRequestHandler):
     routes: dict[str, Callable[[dict[str, list[str]]], tuple[list[str], dict[str, str]]]] = {
         "/run/audit": _build_audit,
@@ -382,9 +643,15 @@ class DashboardHandler(BaseHTTPRequestHandler):
     }
 
     def _send_html(self, body: str, status: HTTPStatus = HTTPStatus.OK) -> None:
-        data = body.encode("utf-8")
+        # The GET landing page is always the same object, so its encoded
+        # (and gzipped) bytes are served from one-shot caches.
+        is_default = body is _default_page()
+        data = _default_page_bytes() if is_default else body.encode("utf-8")
         self.send_response(status)
         self.send_header("Content-Type", "text/html; charset=utf-8")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = _gzip_body(body) if is_default else gzip.compress(data, mtime=0)
+            self.send_header("Content-Encoding", "gzip")
         self.send_header("Content-Length", str(len(data)))
         self.end_headers()
         self.wfile.write(data)
@@ -398,46 +665,111 @@ class DashboardHandler(BaseHTTPRequestHandler):
     def do_POST(self) -> None:
         path = urlparse(self.path).path
         builder = self.routes.get(path)
-        if builder is None:
+        if builder is None and path != "/run/batch":
             self._send_html("<h1>Not Found</h1>", HTTPStatus.NOT_FOUND)
             return
 
         length = int(self.headers.get("Content-Length", "0"))
+        if length > _MAX_POST_BYTES:
+            self._send_html("<h1>Payload Too Large</h1>", HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return
         payload = self.rfile.read(length).decode("utf-8", errors="replace")
-        form = parse_qs(payload, keep_blank_values=True)
+        if path == "/run/batch":
+            self._run_batch(payload)
+            return
+        form = _Form(_parse_form(payload))
 
         try:
             cmd, env = builder(form)
             result = _run_command(cmd, env)
         except DashboardError as exc:
-            result = {
-                "ok": False,
-                "exit_code": 2,
-                "duration_sec": 0.0,
-                "command": "input validation",
-                "stdout": "",
-                "stderr": str(exc),
-            }
+            result = _error_result(2, "input validation", exc)
         except OSError as exc:
-            result = {
-                "ok": False,
-                "exit_code": 3,
-                "duration_sec": 0.0,
-                "command": "runtime error",
-                "stdout": "",
-                "stderr": str(exc),
-            }
+            result = _error_result(3, "runtime error", exc)
 
         self._send_html(_render_page(result=result, form=form))
 
+    def _run_batch(self, payload: str) -> None:
+        try:
+            jobs = json.loads(payload)
+            if not isinstance(jobs, list) or not jobs:
+                raise ValueError("batch payload must be a non-empty JSON array")
+        except ValueError as exc:
+            self._send_html(_render_page(result=_error_result(2, "batch parse", exc)))
+            return
+
+        def _run_job(job: object) -> dict[str, object]:
+            try:
+                if not isinstance(job, dict):
+                    raise DashboardError("Each batch job must be an object.")
+                builder = self.routes.get(str(job.get("path", "")))
+                if builder is None:
+                    raise DashboardError(f"Unknown job path: {job.get('path')!r}")
+                raw_form = job.get("form", {})
+                if not isinstance(raw_form, dict):
+                    raise DashboardError("Job form must be an object.")
+                form = {
+                    key: value if isinstance(value, list) else [str(value)]
+                    for key, value in raw_form.items()
+                }
+                cmd, env = builder(form)
+                # Batch jobs always take the subprocess path: the
+                # in-process path serializes behind _RUN_LOCK (its
+                # stdout/cwd patching is process-global), which would
+                # reduce the pool below to sequential execution.
+                return _run_command(cmd, env, isolated=True)
+            except DashboardError as exc:
+                return _error_result(2, "input validation", exc)
+            except OSError as exc:
+                return _error_result(3, "runtime error", exc)
+
+        with ThreadPoolExecutor(max_workers=min(4, len(jobs))) as pool:
+            results = list(pool.map(_run_job, jobs))
+        self._send_html(_render_batch_page(results))
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer dispatching through a bounded worker pool.
+
+    The stock ThreadingMixIn spawns a fresh thread per connection;
+    reusing a fixed pool skips that per-request spawn and caps how many
+    handlers can pile up behind a slow audit.
+    """
+
+    daemon_threads = True
+    pool_workers = 8
+
+    def server_bind(self) -> None:
+        super().server_bind()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.pool_workers, thread_name_prefix="dqa-web"
+        )
+
+    def process_request(self, request, client_address) -> None:
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=False)
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="DQA local web dashboard")
     parser.add_argument("--host", default="127.0.0.1")
     parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each command in a fresh interpreter instead of in-process",
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Request handler threads (default: 8)")
     args = parser.parse_args()
 
-    server = ThreadingHTTPServer((args.host, args.port), DashboardHandler)
+    global ISOLATED
+    ISOLATED = args.isolated
+
+    PooledHTTPServer.pool_workers = max(1, args.workers)
+    server = PooledHTTPServer((args.host, args.port), DashboardHandler)
     print(f"DQA dashboard running at http://{args.host}:{args.port}")
     print("Press Ctrl+C to stop")
 